@@ -184,28 +184,7 @@ class UnifiedA2AClientHelper:
                 # For streaming agents (like AWS Strands), return only the final/longest response
                 # to avoid UI showing partial/repeated content
                 if len(all_responses) > 1:
-                    # Filter out fallback responses like "Task completed: Task"
-                    meaningful_responses = [
-                        r
-                        for r in all_responses
-                        if not r.startswith("Task completed:")
-                        and not r.startswith("Response:")
-                    ]
-
-                    if meaningful_responses:
-                        # Find the longest meaningful response (likely the final complete one)
-                        final_response = max(meaningful_responses, key=len)
-                        logger.info(
-                            f"🔄 Streaming agent detected, returning final meaningful response (length: {len(final_response)})"
-                        )
-                        return [final_response]
-                    else:
-                        # Fall back to longest response even if it's a fallback message
-                        final_response = max(all_responses, key=len)
-                        logger.info(
-                            f"⚠️ Only fallback responses available, returning longest (length: {len(final_response)})"
-                        )
-                        return [final_response]
+                    return [self._pick_best_response(all_responses)]
                 else:
                     # Single response (like Google ADK), return as-is
                     return all_responses
@@ -215,6 +194,37 @@ class UnifiedA2AClientHelper:
                 await client.close()
                 logger.info("✅ A2A client closed")
 
+    def _pick_best_response(self, responses: List[str]) -> str:
+        """Pick the final response from a stream of partial responses.
+
+        Args:
+            responses: Response texts received from a streaming agent
+
+        Returns:
+            Longest meaningful response, or the longest response overall when
+            only fallback messages were received
+        """
+        # Filter out fallback responses like "Task completed: Task"
+        meaningful_responses = [
+            r
+            for r in responses
+            if not r.startswith("Task completed:") and not r.startswith("Response:")
+        ]
+
+        if meaningful_responses:
+            # Find the longest meaningful response (likely the final complete one)
+            final_response = max(meaningful_responses, key=len)
+            logger.info(
+                f"🔄 Streaming agent detected, returning final meaningful response (length: {len(final_response)})"
+            )
+        else:
+            # Fall back to longest response even if it's a fallback message
+            final_response = max(responses, key=len)
+            logger.info(
+                f"⚠️ Only fallback responses available, returning longest (length: {len(final_response)})"
+            )
+        return final_response
+
     async def _create_a2a_client(self, base_url: str, httpx_client: httpx.AsyncClient):
         """Create A2A client using official patterns from PRD.
 
@@ -4,7 +4,9 @@ Defines clear separation of concerns between shared modules to eliminate
 overlapping responsibilities and establish proper dependency relationships.
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, replace
+from graphlib import CycleError, TopologicalSorter
 from typing import Dict, Any, Optional, Protocol
 
 
@@ -48,7 +50,21 @@ class ModuleBoundaryRegistry:
 
     def __init__(self):
         """Initialize registry with defined module boundaries."""
-        self._boundaries = self._define_boundaries()
+        self._boundaries = {
+            sys.intern(name): self._intern_boundary(boundary)
+            for name, boundary in self._define_boundaries().items()
+        }
+
+    @staticmethod
+    def _intern_boundary(boundary: ModuleBoundary) -> ModuleBoundary:
+        """Intern module-name strings so registry comparisons hit identity."""
+        return replace(
+            boundary,
+            name=sys.intern(boundary.name),
+            interfaces=[sys.intern(item) for item in boundary.interfaces],
+            dependencies=[sys.intern(item) for item in boundary.dependencies],
+            consumers=[sys.intern(item) for item in boundary.consumers],
+        )
 
     def _define_boundaries(self) -> Dict[str, ModuleBoundary]:
         """Define the boundaries for all shared modules."""
@@ -140,28 +156,26 @@ class ModuleBoundaryRegistry:
         Returns:
             List of modules in dependency order (dependencies first)
         """
-        # Simple topological sort based on dependencies
-        ordered = []
-        remaining = set(self._boundaries.keys())
-
-        while remaining:
-            # Find modules with no unresolved dependencies
-            ready = []
-            for module in remaining:
-                deps = self.get_dependencies(module)
-                if not deps or all(
-                    dep in ordered or dep not in remaining for dep in deps
-                ):
-                    ready.append(module)
-
-            if not ready:
-                # Circular dependency detected
-                raise ValueError(f"Circular dependency detected among: {remaining}")
-
+        # Only registered modules take part in ordering; external deps are ignored
+        sorter: TopologicalSorter[str] = TopologicalSorter(
+            {
+                name: [dep for dep in boundary.dependencies if dep in self._boundaries]
+                for name, boundary in self._boundaries.items()
+            }
+        )
+        try:
+            sorter.prepare()
+        except CycleError as cycle_error:
+            raise ValueError(
+                f"Circular dependency detected among: {set(cycle_error.args[1])}"
+            ) from cycle_error
+
+        ordered: list[str] = []
+        while sorter.is_active():
             # Sort ready modules alphabetically for consistency
-            ready.sort()
+            ready = sorted(sorter.get_ready())
             ordered.extend(ready)
-            remaining -= set(ready)
+            sorter.done(*ready)
 
         return ordered
 
@@ -7,21 +7,29 @@ by providing a standardized interface that abstracts framework differences.
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from string import Template
+from typing import ClassVar, Dict, Optional, Tuple, Type
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UIConfig:
-    """Configuration for UI route generation."""
+    """Configuration for UI route generation.
+
+    Frozen so instances are hashable and can key the route rendering cache;
+    slotted so the many short-lived configs built during codegen stay small.
+    """
+
+    DOCKER_STATIC_DIR: ClassVar[str] = "/app/static"
 
     add_ui: bool
     framework: str  # "adk", "strands", "generic"
     deployment_type: str  # "docker", "localhost"
     port: Optional[int] = None
     agent_name: Optional[str] = None
-    static_dir: str = "/app/static"  # Docker default
+    static_dir: str = DOCKER_STATIC_DIR
     localhost_static_dir: Optional[str] = None
 
 
@@ -51,24 +59,8 @@ class UIRouteBuilder(ABC):
         return self.config.static_dir
 
 
-class StarletteUIRouteBuilder(UIRouteBuilder):
-    """Starlette-style UI route builder."""
-
-    def generate_routes(self) -> str:
-        """Generate Starlette-style UI routes."""
-        if not self.config.add_ui:
-            return ""
-
-        static_dir = self._get_static_dir()
-
-        if self.config.deployment_type == "localhost":
-            return self._generate_localhost_starlette_routes(static_dir)
-        else:
-            return self._generate_docker_starlette_routes(static_dir)
-
-    def _generate_docker_starlette_routes(self, static_dir: str) -> str:
-        """Generate Docker-specific Starlette routes."""
-        return f"""
+# Route code templates, compiled once at import and filled per configuration
+_DOCKER_STARLETTE_TEMPLATE = Template("""
     # Add UI routes (Starlette style)
     from starlette.responses import HTMLResponse, FileResponse
     from starlette.staticfiles import StaticFiles
@@ -76,20 +68,20 @@ class StarletteUIRouteBuilder(UIRouteBuilder):
     import os
 
     # Mount static files
-    if os.path.exists("{static_dir}"):
-        static_mount = Mount("/static", StaticFiles(directory="{static_dir}"), name="static")
+    if os.path.exists("$static_dir"):
+        static_mount = Mount("/static", StaticFiles(directory="$static_dir"), name="static")
         app.routes.append(static_mount)
-        if os.path.exists("{static_dir}/assets"):
-            assets_mount = Mount("/assets", StaticFiles(directory="{static_dir}/assets"), name="assets")
+        if os.path.exists("$static_dir/assets"):
+            assets_mount = Mount("/assets", StaticFiles(directory="$static_dir/assets"), name="assets")
             app.routes.append(assets_mount)
 
     async def serve_spa(request):
         try:
-            index_path = "{static_dir}/index.html"
+            index_path = "$static_dir/index.html"
             if os.path.exists(index_path):
                 return FileResponse(index_path)
             else:
-                return HTMLResponse("<h1>UI Not Available</h1><p>React SPA could not be loaded for {self.config.agent_name or "agent"}.</p>", status_code=503)
+                return HTMLResponse("<h1>UI Not Available</h1><p>React SPA could not be loaded for $agent_name.</p>", status_code=503)
         except Exception:
             return HTMLResponse("<h1>Error</h1><p>Failed to serve UI.</p>", status_code=500)
 
@@ -98,13 +90,9 @@ class StarletteUIRouteBuilder(UIRouteBuilder):
         Route("/describe", serve_spa, methods=["GET"])
     ]
     app.routes.extend(ui_routes)
-"""
+""")
 
-    def _generate_localhost_starlette_routes(self, static_dir: str) -> str:
-        """Generate localhost-specific Starlette routes."""
-        agent_name = self.config.agent_name or "agent"
-
-        return f"""
+_LOCALHOST_STARLETTE_TEMPLATE = Template("""
     # Add static file serving if UI enabled (localhost mode)
     if True:
         from starlette.staticfiles import StaticFiles
@@ -115,7 +103,7 @@ class StarletteUIRouteBuilder(UIRouteBuilder):
         static_dir = Path(__file__).parent / "static"
         if static_dir.exists():
             app.mount("/assets", StaticFiles(directory=static_dir / "assets"), name="assets")
-            logger.info(f"📁 Mounted static files from {{static_dir}}")
+            logger.info(f"📁 Mounted static files from {static_dir}")
 
             # Add route to serve index.html at root
             async def serve_ui(request):
@@ -124,56 +112,116 @@ class StarletteUIRouteBuilder(UIRouteBuilder):
                     return FileResponse(index_file)
                 else:
                     from starlette.responses import JSONResponse
-                    return JSONResponse({{
-                        "agent": "{agent_name}",
-                        "framework": "{self.config.framework}",
+                    return JSONResponse({
+                        "agent": "$agent_name",
+                        "framework": "$framework",
                         "localhost_mode": True,
                         "status": "ui_enabled",
                         "error": "UI files not found"
-                    }})
+                    })
 
             # Add UI route at root
             ui_route = Route("/", serve_ui, methods=["GET"])
             app.routes.append(ui_route)
         else:
             logger.warning("📁 Static directory not found - UI files not served")
-"""
-
-
-class FastAPIUIRouteBuilder(UIRouteBuilder):
-    """FastAPI-style UI route builder."""
-
-    def generate_routes(self) -> str:
-        """Generate FastAPI-style UI routes."""
-        if not self.config.add_ui:
-            return ""
+""")
 
-        static_dir = self._get_static_dir()
-
-        return f"""
+_DOCKER_FASTAPI_TEMPLATE = Template("""
     # Add UI routes (FastAPI style)
     from fastapi.responses import HTMLResponse, FileResponse
     from fastapi.staticfiles import StaticFiles
     import os
 
     # Mount static files
-    if os.path.exists("{static_dir}"):
-        app.mount("/static", StaticFiles(directory="{static_dir}"), name="static")
-        if os.path.exists("{static_dir}/assets"):
-            app.mount("/assets", StaticFiles(directory="{static_dir}/assets"), name="assets")
+    if os.path.exists("$static_dir"):
+        app.mount("/static", StaticFiles(directory="$static_dir"), name="static")
+        if os.path.exists("$static_dir/assets"):
+            app.mount("/assets", StaticFiles(directory="$static_dir/assets"), name="assets")
 
     @app.get("/")
     @app.get("/describe")
     async def serve_spa():
         try:
-            index_path = "{static_dir}/index.html"
+            index_path = "$static_dir/index.html"
             if os.path.exists(index_path):
                 return FileResponse(index_path)
             else:
-                return HTMLResponse("<h1>UI Not Available</h1><p>React SPA could not be loaded for {self.config.agent_name or "agent"}.</p>", status_code=503)
+                return HTMLResponse("<h1>UI Not Available</h1><p>React SPA could not be loaded for $agent_name.</p>", status_code=503)
         except Exception:
             return HTMLResponse("<h1>Error</h1><p>Failed to serve UI.</p>", status_code=500)
-"""
+""")
+
+
+class StarletteUIRouteBuilder(UIRouteBuilder):
+    """Starlette-style UI route builder."""
+
+    def generate_routes(self) -> str:
+        """Generate Starlette-style UI routes."""
+        if not self.config.add_ui:
+            return ""
+
+        static_dir = self._get_static_dir()
+
+        if self.config.deployment_type == "localhost":
+            return self._generate_localhost_starlette_routes(static_dir)
+        else:
+            return self._generate_docker_starlette_routes(static_dir)
+
+    def _generate_docker_starlette_routes(self, static_dir: str) -> str:
+        """Generate Docker-specific Starlette routes."""
+        return _DOCKER_STARLETTE_TEMPLATE.substitute(
+            static_dir=static_dir, agent_name=self.config.agent_name or "agent"
+        )
+
+    def _generate_localhost_starlette_routes(self, static_dir: str) -> str:
+        """Generate localhost-specific Starlette routes."""
+        return _LOCALHOST_STARLETTE_TEMPLATE.substitute(
+            agent_name=self.config.agent_name or "agent",
+            framework=self.config.framework,
+        )
+
+
+class FastAPIUIRouteBuilder(UIRouteBuilder):
+    """FastAPI-style UI route builder."""
+
+    def generate_routes(self) -> str:
+        """Generate FastAPI-style UI routes."""
+        if not self.config.add_ui:
+            return ""
+
+        return _DOCKER_FASTAPI_TEMPLATE.substitute(
+            static_dir=self._get_static_dir(),
+            agent_name=self.config.agent_name or "agent",
+        )
+
+
+# Builder selection keyed by (framework, deployment_type). Localhost always uses
+# Starlette, so it is matched through a framework wildcard.
+_BUILDER_DISPATCH: Dict[Tuple[str, str], Type[UIRouteBuilder]] = {
+    ("adk", "docker"): StarletteUIRouteBuilder,
+    ("strands", "docker"): StarletteUIRouteBuilder,
+    ("*", "localhost"): StarletteUIRouteBuilder,
+}
+
+
+def _select_builder_class(config: UIConfig) -> Type[UIRouteBuilder]:
+    """Look up the builder for a configuration, defaulting to FastAPI."""
+    builder_class = _BUILDER_DISPATCH.get(
+        (config.framework, config.deployment_type)
+    ) or _BUILDER_DISPATCH.get(("*", config.deployment_type))
+    # Use FastAPI for generic frameworks
+    return builder_class or FastAPIUIRouteBuilder
+
+
+@lru_cache(maxsize=64)
+def _render_ui_routes(config: UIConfig) -> str:
+    """Render UI routes for a configuration, memoized per ``UIConfig``.
+
+    Route generation is pure string templating over a small key space, so
+    repeated agent builds with the same configuration reuse the rendered code.
+    """
+    return _select_builder_class(config)(config).generate_routes()
 
 
 class UnifiedUIRouteGenerator:
@@ -191,19 +239,7 @@ class UnifiedUIRouteGenerator:
         if not config.add_ui:
             return ""
 
-        # Select builder based on framework and requirements
-        builder: UIRouteBuilder
-        if (
-            config.framework in ["adk", "strands"]
-            or config.deployment_type == "localhost"
-        ):
-            # Use Starlette for A2A compatibility and localhost
-            builder = StarletteUIRouteBuilder(config)
-        else:
-            # Use FastAPI for generic frameworks
-            builder = FastAPIUIRouteBuilder(config)
-
-        return builder.generate_routes()
+        return _render_ui_routes(config)
 
     def generate_localhost_ui_routes(
         self, add_ui: bool, port: int, agent_name: str, framework: str = "generic"
@@ -8,13 +8,40 @@ Centralizes all URL construction patterns to eliminate duplication across:
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 from .url_utils import localhost_urls
 
 
+@lru_cache(maxsize=8)
+def _parse_port(raw_port: Optional[str], default: int) -> int:
+    """Parse a raw AGENT_PORT value, memoized per (value, default) pair.
+
+    Args:
+        raw_port: Raw environment value, or None when unset
+        default: Port to use when the value is missing or invalid
+
+    Returns:
+        Parsed port number or default
+    """
+    if raw_port is None:
+        return default
+    try:
+        return int(raw_port)
+    except ValueError:
+        return default
+
+
 class ConsolidatedURLBuilder:
     """Consolidated URL builder that handles all framework URL patterns."""
 
+    # (key, path suffix) pairs appended to the agent base URL for chat endpoints
+    _CHAT_SUFFIXES = (
+        ("agent_base", ""),
+        ("health", "/health"),
+        ("agent_card", "/.well-known/agent-card.json"),
+    )
+
     def __init__(self, deployment_type: str = "docker"):
         """Initialize builder for specific deployment type.
 
@@ -33,12 +60,11 @@ class ConsolidatedURLBuilder:
         Returns:
             Default agent URL for current deployment context
         """
+        port = port or self.get_environment_port()
         if self.deployment_type == "localhost":
-            port = port or int(os.getenv("AGENT_PORT", "8080"))
             return self.localhost_builder.base_url(port)
         else:
             # Docker deployment - use environment port
-            port = port or int(os.getenv("AGENT_PORT", "8080"))
             return f"http://localhost:{port}"
 
     def agent_url_with_fallback(
@@ -65,11 +91,7 @@ class ConsolidatedURLBuilder:
             Dictionary with chat-related URLs
         """
         base = self.default_agent_url(port)
-        return {
-            "agent_base": base,
-            "health": f"{base}/health",
-            "agent_card": f"{base}/.well-known/agent-card.json",
-        }
+        return {key: base + suffix for key, suffix in self._CHAT_SUFFIXES}
 
     def get_environment_port(self, default: int = 8080) -> int:
         """Get port from AGENT_PORT environment variable.
@@ -80,10 +102,7 @@ class ConsolidatedURLBuilder:
         Returns:
             Port number from environment or default
         """
-        try:
-            return int(os.getenv("AGENT_PORT", str(default)))
-        except (ValueError, TypeError):
-            return default
+        return _parse_port(os.environ.get("AGENT_PORT"), default)
 
 
 # Singleton instances for common use cases
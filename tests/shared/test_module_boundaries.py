@@ -2,7 +2,7 @@
 
 import pytest
 
-from src.any_agent.shared.module_boundaries import (
+from any_agent.shared.module_boundaries import (
     ModuleBoundary,
     ModuleBoundaryRegistry,
     module_registry,
@@ -11,6 +11,12 @@ from src.any_agent.shared.module_boundaries import (
 )
 
 
+@pytest.fixture(scope="module")
+def registry():
+    """Provide one read-only registry shared across the module's tests."""
+    return ModuleBoundaryRegistry()
+
+
 class TestModuleBoundary:
     """Test ModuleBoundary dataclass."""
 
@@ -34,9 +40,8 @@ class TestModuleBoundary:
 class TestModuleBoundaryRegistry:
     """Test ModuleBoundaryRegistry functionality."""
 
-    def test_registry_initialization(self):
+    def test_registry_initialization(self, registry):
         """Test registry initializes with predefined boundaries."""
-        registry = ModuleBoundaryRegistry()
         modules = registry.list_modules()
 
         expected_modules = {
@@ -51,9 +56,8 @@ class TestModuleBoundaryRegistry:
 
         assert set(modules) == expected_modules
 
-    def test_get_boundary_existing(self):
+    def test_get_boundary_existing(self, registry):
         """Test getting boundary for existing module."""
-        registry = ModuleBoundaryRegistry()
         boundary = registry.get_boundary("url_builder")
 
         assert boundary is not None
@@ -61,31 +65,27 @@ class TestModuleBoundaryRegistry:
         assert "Consolidated URL construction" in boundary.primary_responsibility
         assert "url_utils" in boundary.dependencies
 
-    def test_get_boundary_nonexistent(self):
+    def test_get_boundary_nonexistent(self, registry):
         """Test getting boundary for non-existent module."""
-        registry = ModuleBoundaryRegistry()
         boundary = registry.get_boundary("nonexistent_module")
 
         assert boundary is None
 
-    def test_get_dependencies(self):
+    def test_get_dependencies(self, registry):
         """Test getting dependencies for a module."""
-        registry = ModuleBoundaryRegistry()
         deps = registry.get_dependencies("url_builder")
 
         assert "url_utils" in deps
 
-    def test_get_consumers(self):
+    def test_get_consumers(self, registry):
         """Test getting consumers for a module."""
-        registry = ModuleBoundaryRegistry()
         consumers = registry.get_consumers("url_builder")
 
         # url_builder should be consumed by chat_endpoints_generator
         assert "chat_endpoints_generator" in consumers
 
-    def test_validate_dependency_order(self):
+    def test_validate_dependency_order(self, registry):
         """Test dependency order validation."""
-        registry = ModuleBoundaryRegistry()
         order = registry.validate_dependency_order()
 
         # url_utils should come before url_builder
@@ -103,18 +103,39 @@ class TestModuleBoundaryRegistry:
         template_idx = order.index("entrypoint_templates")
         assert chat_idx < template_idx
 
-    def test_detect_violations_none_expected(self):
-        """Test that no violations are detected in well-designed boundaries."""
+    def test_validate_dependency_order_detects_cycle(self):
+        """Test that circular dependencies raise ValueError."""
+        # Mutates the registry, so build a fresh one instead of the shared fixture
         registry = ModuleBoundaryRegistry()
+        registry._boundaries = {
+            "module_a": ModuleBoundary(
+                name="module_a",
+                primary_responsibility="First module",
+                interfaces=[],
+                dependencies=["module_b"],
+                consumers=[],
+            ),
+            "module_b": ModuleBoundary(
+                name="module_b",
+                primary_responsibility="Second module",
+                interfaces=[],
+                dependencies=["module_a"],
+                consumers=[],
+            ),
+        }
+
+        with pytest.raises(ValueError, match="Circular dependency detected"):
+            registry.validate_dependency_order()
+
+    def test_detect_violations_none_expected(self, registry):
+        """Test that no violations are detected in well-designed boundaries."""
         violations = registry.detect_violations()
 
         # Should have no violations in our consolidated architecture
         assert len(violations) == 0, f"Unexpected violations: {violations}"
 
-    def test_acceptable_overlap(self):
+    def test_acceptable_overlap(self, registry):
         """Test that acceptable overlaps are not flagged as violations."""
-        registry = ModuleBoundaryRegistry()
-
         # URL overlap between url_utils and url_builder is acceptable
         assert registry._is_acceptable_overlap("url", ["url_utils", "url_builder"])
 
@@ -27,6 +27,21 @@ class TestUIConfig:
         assert config.port is None
         assert config.static_dir == "/app/static"
 
+    def test_ui_config_is_hashable(self):
+        """Test that equal UIConfigs hash equally and cannot be mutated."""
+        config = UIConfig(add_ui=True, framework="adk", deployment_type="docker")
+        same = UIConfig(add_ui=True, framework="adk", deployment_type="docker")
+        assert hash(config) == hash(same)
+
+        with pytest.raises(AttributeError):
+            config.port = 8080  # type: ignore[misc]
+
+    def test_ui_config_uses_slots(self):
+        """Test that UIConfig instances carry no per-instance __dict__."""
+        config = UIConfig(add_ui=True, framework="adk", deployment_type="docker")
+        assert not hasattr(config, "__dict__")
+        assert config.static_dir == UIConfig.DOCKER_STATIC_DIR
+
 
 class TestStarletteUIRouteBuilder:
     """Test Starlette UI route builder."""
@@ -156,6 +171,24 @@ class TestUnifiedUIRouteGenerator:
         # Should use Starlette even for generic framework
         assert "from starlette" in result
 
+    def test_unknown_framework_uses_fastapi_in_docker(self):
+        """Test that frameworks without a dispatch entry fall back to FastAPI."""
+        config = UIConfig(add_ui=True, framework="langchain", deployment_type="docker")
+        result = UnifiedUIRouteGenerator().generate_ui_routes(config)
+
+        assert "from fastapi.responses" in result
+
+    def test_repeated_config_uses_cached_routes(self):
+        """Test that equal configs reuse the cached rendered routes."""
+        generator = UnifiedUIRouteGenerator()
+        first = generator.generate_ui_routes(
+            UIConfig(add_ui=True, framework="adk", deployment_type="docker")
+        )
+        second = generator.generate_ui_routes(
+            UIConfig(add_ui=True, framework="adk", deployment_type="docker")
+        )
+        assert first is second
+
     def test_legacy_localhost_ui_routes(self):
         """Test legacy localhost UI routes method."""
         generator = UnifiedUIRouteGenerator()
@@ -174,6 +207,15 @@ class TestUnifiedUIRouteGenerator:
         assert "from starlette" in result  # ADK uses Starlette
         assert "/app/static" in result
 
+    def test_legacy_docker_ui_routes_share_cache(self):
+        """Test that legacy and config-based calls share rendered routes."""
+        generator = UnifiedUIRouteGenerator()
+        legacy = generator.generate_docker_ui_routes(add_ui=True, framework="strands")
+        direct = generator.generate_ui_routes(
+            UIConfig(add_ui=True, framework="strands", deployment_type="docker")
+        )
+        assert legacy is direct
+
     def test_singleton_instance(self):
         """Test that singleton instance exists and works."""
         result = unified_ui_generator.generate_docker_ui_routes(
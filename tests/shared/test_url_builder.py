@@ -4,7 +4,7 @@ import os
 from unittest.mock import patch
 import pytest
 
-from src.any_agent.shared.url_builder import (
+from any_agent.shared.url_builder import (
     ConsolidatedURLBuilder,
     get_url_builder,
     docker_url_builder,
@@ -71,6 +71,20 @@ class TestConsolidatedURLBuilder:
         port = builder.get_environment_port(3000)
         assert port == 7777
 
+    @patch.dict(os.environ, {"AGENT_PORT": "invalid"})
+    def test_default_agent_url_with_invalid_env(self):
+        """Test URL generation falls back when environment port is invalid."""
+        builder = ConsolidatedURLBuilder("docker")
+        assert builder.default_agent_url() == "http://localhost:8080"
+
+    def test_get_environment_port_tracks_env_changes(self):
+        """Test cached port parsing still reflects environment changes."""
+        builder = ConsolidatedURLBuilder("docker")
+        with patch.dict(os.environ, {"AGENT_PORT": "7001"}):
+            assert builder.get_environment_port() == 7001
+        with patch.dict(os.environ, {"AGENT_PORT": "7002"}):
+            assert builder.get_environment_port() == 7002
+
 
 class TestFactoryFunctions:
     """Test factory functions and singletons."""
@@ -96,4 +110,13 @@ class TestFactoryFunctions:
         """Test that get_url_builder returns consistent instances."""
         builder1 = get_url_builder("localhost")
         builder2 = get_url_builder("localhost")
-        assert builder1 is builder2
\ No newline at end of file
+        assert builder1 is builder2
+
+    def test_get_url_builder_returns_singletons(self):
+        """Test that get_url_builder hands back the module-level singletons."""
+        assert get_url_builder("docker") is docker_url_builder
+        assert get_url_builder("localhost") is localhost_url_builder
+
+    def test_get_url_builder_other_types_use_docker(self):
+        """Test that any non-localhost type maps to the docker singleton."""
+        assert get_url_builder("kubernetes") is docker_url_builder
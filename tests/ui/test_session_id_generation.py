@@ -47,8 +47,8 @@ class TestSessionIdGeneration:
         timestamp_pattern = re.compile(r"session_([a-z0-9]+)_([a-z0-9]{12})")
 
         # Simulate different timestamps (base36 encoded)
-        timestamp1 = hex(1704067200000)[2:]  # 2024-01-01 timestamp
-        timestamp2 = hex(1704067260000)[2:]  # 2024-01-01 + 1 minute
+        timestamp1 = format(1704067200000, "x")  # 2024-01-01 timestamp
+        timestamp2 = format(1704067260000, "x")  # 2024-01-01 + 1 minute
 
         session1 = f"session_{timestamp1}_abcdef123456"
         session2 = f"session_{timestamp2}_abcdef123456"
@@ -106,7 +106,7 @@ class TestSessionIdGeneration:
         """Test that session ID includes meaningful timestamp component."""
         # Timestamp should be current time in base36
         current_time_ms = 1704067200000  # Example: 2024-01-01
-        base36_timestamp = hex(current_time_ms)[2:]  # Convert to base36-like
+        base36_timestamp = format(current_time_ms, "x")  # Convert to base36-like
 
         # Expected session ID format
         expected_pattern = f"session_{base36_timestamp}_[a-z0-9]{{12}}"
@@ -0,0 +1,22 @@
+"""Builders for fake A2A client responses shared by the A2A unit tests."""
+
+from unittest.mock import Mock
+
+
+def model_dump_response(payload):
+    """Build a response mock whose model_dump() returns ``payload``."""
+    response = Mock()
+    response.model_dump.return_value = payload
+    return response
+
+
+def build_response(payload, kind=None):
+    """Wrap ``payload`` the way an A2A client of the given ``kind`` returns it.
+
+    Any other ``kind``, including ``None``, returns ``payload`` unchanged.
+    """
+    if kind == "model_dump":
+        return model_dump_response(payload)
+    if kind == "task_tuple":
+        return (model_dump_response(payload),)
+    return payload
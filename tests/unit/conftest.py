@@ -0,0 +1,210 @@
+"""Shared fixtures for unit tests."""
+
+import io
+import json
+import shutil
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Sequence
+from unittest.mock import Mock
+
+import click
+import pytest
+from click.testing import CliRunner, Result
+
+# Imported at collection so the CLI import graph is not charged to the first test
+from any_agent import cli
+from any_agent.cli import main
+from any_agent.core import agent_context
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmark tests unless a benchmark run was asked for.
+
+    Benchmarks are only useful when compared against a saved baseline, so a
+    plain ``pytest`` run skips them; ``--benchmark-only`` or
+    ``--benchmark-enable`` runs them. They are also skipped when the
+    pytest-benchmark plugin is not active, since their fixture is missing then.
+    """
+    if config.pluginmanager.hasplugin("benchmark"):
+        if config.getoption("benchmark_only") or config.getoption("benchmark_enable"):
+            return
+        reason = "benchmarks run with --benchmark-only or --benchmark-enable"
+    else:
+        reason = "pytest-benchmark plugin is not active"
+    skip_benchmark = pytest.mark.skip(reason=reason)
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip_benchmark)
+
+
+@dataclass(frozen=True)
+class AgentFS:
+    """Absolute paths to the sample agent layouts built by ``agent_fs``."""
+
+    root: Path
+    test_agent: Path
+    a2a_app: Path
+    adk_agent: Path
+    agent_dir: Path
+    output_dir: Path
+    config_file: Path
+
+
+def _write(path: Path, content: str) -> Path:
+    """Write ``content`` to ``path``, creating parent directories."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+@lru_cache(maxsize=None)
+def _make_agent_dir(root: Path, name: str, body: str) -> Path:
+    """Create ``root/name`` with an ``__init__.py`` holding ``body``, once per key."""
+    return _write(root / name / "__init__.py", body).parent
+
+
+@pytest.fixture(scope="session")
+def agent_fs(tmp_path_factory) -> AgentFS:
+    """Build the sample agent directories once for all CLI dry-run tests.
+
+    ``--dry-run`` never writes to the agent directory, so every test can
+    point the CLI at the same read-only tree by absolute path.
+    """
+    root = tmp_path_factory.mktemp("agents")
+
+    _make_agent_dir(root, "test_agent", "# Test agent")
+    _write(root / "a2a_agent" / "a2a_app.py", "# Test agent file")
+    # One ADK layout serves every ADK test; it is the richest variant needed
+    _write(root / "my_adk_agent" / "__init__.py", "# ADK Agent Root")
+    _write(root / "my_adk_agent" / "agent.py", "# Agent implementation")
+    _write(root / "my_adk_agent" / "requirements.txt", "google-cloud-functions\n")
+    _make_agent_dir(root, "agent_dir", "# Agent")
+    (root / "output_dir").mkdir()
+    config_file = _write(
+        root / "config.json",
+        json.dumps({"agent": {"name": "test-config-agent", "framework": "adk"}}),
+    )
+
+    return AgentFS(
+        root=root,
+        test_agent=root / "test_agent",
+        a2a_app=root / "a2a_agent" / "a2a_app.py",
+        adk_agent=root / "my_adk_agent",
+        agent_dir=root / "agent_dir",
+        output_dir=root / "output_dir",
+        config_file=config_file,
+    )
+
+
+@pytest.fixture(scope="session")
+def make_agent_dir(agent_fs: AgentFS) -> Callable[[str, str], Path]:
+    """Return a memoized builder for single-module agent dirs under ``agent_fs``.
+
+    Calling it with the same ``(name, body)`` again returns the existing
+    directory without touching the disk.
+    """
+    return partial(_make_agent_dir, agent_fs.root)
+
+
+@pytest.fixture(scope="session")
+def invoke_cli() -> Callable[[Sequence[str]], SimpleNamespace]:
+    """Provide an in-process invoker for the ``main`` click command.
+
+    Parses ``args`` and runs the command callback directly with stdout and
+    stderr captured, skipping ``CliRunner``'s stream and environment
+    isolation. Use ``CliRunner`` for ``--help``/``--version`` and anything
+    that relies on click's standalone exit handling.
+    """
+
+    def _invoke(args: Sequence[str]) -> SimpleNamespace:
+        buffer = io.StringIO()
+        with redirect_stdout(buffer), redirect_stderr(buffer):
+            try:
+                with main.make_context("main", list(args)) as ctx:
+                    main.invoke(ctx)
+                exit_code = 0
+            except click.exceptions.Exit as exit_request:
+                exit_code = exit_request.exit_code
+            except click.ClickException as click_error:
+                click_error.show()
+                exit_code = click_error.exit_code
+            except click.Abort:
+                exit_code = 1
+            except SystemExit as system_exit:
+                exit_code = system_exit.code or 0
+        return SimpleNamespace(exit_code=exit_code, output=buffer.getvalue())
+
+    return _invoke
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Provide one CliRunner; it keeps no state between invocations."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def help_result(runner: CliRunner) -> Result:
+    """Render ``main --help`` once; help text is static for a test session."""
+    return runner.invoke(main, ["--help"])
+
+
+@pytest.fixture(scope="session")
+def version_result(runner: CliRunner) -> Result:
+    """Run ``main --version`` once; the version is static for a test session."""
+    return runner.invoke(main, ["--version"])
+
+
+@pytest.fixture
+def fresh_agent(agent_fs: AgentFS) -> Callable[..., Path]:
+    """Return a helper that copies the template ``test_agent`` to ``dest``.
+
+    For tests that may write into the agent directory, such as non-dry-run or
+    ``--localhost`` invocations. Relative ``dest`` paths resolve against the
+    current directory, so this pairs with ``CliRunner.isolated_filesystem()``.
+    """
+
+    def _copy(dest: str = "test_agent") -> Path:
+        return Path(shutil.copytree(agent_fs.test_agent, dest))
+
+    return _copy
+
+
+@pytest.fixture
+def mock_orchestrator(monkeypatch) -> Mock:
+    """Replace the AgentOrchestrator name the CLI module looks up with a Mock."""
+    orchestrator_class = Mock()
+    monkeypatch.setattr(cli, "AgentOrchestrator", orchestrator_class)
+    return orchestrator_class
+
+
+@pytest.fixture
+def mock_context(monkeypatch) -> Mock:
+    """Replace AgentContextManager in its defining module with a Mock.
+
+    The CLI imports it inside ``main`` at call time, so the defining module is
+    where the lookup happens.
+    """
+    context_class = Mock()
+    monkeypatch.setattr(agent_context, "AgentContextManager", context_class)
+    return context_class
+
+
+@pytest.fixture
+def mock_ui(monkeypatch) -> Mock:
+    """Replace the UIBuildManager name the CLI module looks up with a Mock."""
+    ui_manager_class = Mock()
+    monkeypatch.setattr(cli, "UIBuildManager", ui_manager_class)
+    return ui_manager_class
+
+
+@pytest.fixture
+def mock_port_checker(monkeypatch) -> Mock:
+    """Replace the PortChecker name the CLI module looks up with a Mock."""
+    port_checker_class = Mock()
+    monkeypatch.setattr(cli, "PortChecker", port_checker_class)
+    return port_checker_class
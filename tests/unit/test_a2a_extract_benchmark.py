@@ -0,0 +1,58 @@
+"""Benchmarks for A2A response content extraction.
+
+``UnifiedA2AClientHelper._extract_response_content`` runs once per streamed
+agent response, so its cost is pinned here to catch regressions. Save a
+baseline with ``--benchmark-only --benchmark-autosave`` and compare later runs
+against it with ``--benchmark-compare``.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from any_agent.api.unified_a2a_client_helper import UnifiedA2AClientHelper
+
+from tests.unit.a2a_responses import model_dump_response
+
+_TEXT = "x" * 1024
+
+
+# Representative response shapes, sized like a long streamed agent answer
+RESPONSE_SHAPES = [
+    pytest.param(
+        model_dump_response({"artifacts": [{"parts": [{"text": _TEXT}] * 8}] * 8}),
+        id="model_dump_artifacts",
+    ),
+    pytest.param(
+        model_dump_response({"parts": [{"text": _TEXT}] * 8}),
+        id="model_dump_parts",
+    ),
+    pytest.param(
+        (
+            model_dump_response(
+                {"history": [{"role": "agent", "parts": [{"text": _TEXT}]}] * 8}
+            ),
+        ),
+        id="tuple_task_history",
+    ),
+    pytest.param(
+        (model_dump_response({"status": {"message": {"parts": [{"text": _TEXT}]}}}),),
+        id="tuple_task_status",
+    ),
+    pytest.param(_TEXT, id="string"),
+    pytest.param({"content": _TEXT}, id="dict"),
+]
+
+
+@pytest.fixture(scope="module")
+def helper():
+    """Provide one UnifiedA2AClientHelper for all benchmarks."""
+    return UnifiedA2AClientHelper()
+
+
+@pytest.mark.benchmark(group="extract")
+@pytest.mark.parametrize("response", RESPONSE_SHAPES)
+def test_extract_response_content_perf(benchmark, helper, response):
+    """Benchmark content extraction for each supported response shape."""
+    result = benchmark(helper._extract_response_content, response)
+    assert result
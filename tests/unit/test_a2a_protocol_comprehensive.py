@@ -8,15 +8,168 @@ This module provides extensive testing of all A2A protocol components including:
 """
 
 import asyncio
+import copy
+import httpx
 import pytest
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+from any_agent.api import unified_a2a_client_helper as a2a_client_module
 from any_agent.api.unified_a2a_client_helper import UnifiedA2AClientHelper
+from any_agent.validation import a2a_message_validator as a2a_validator_module
 from any_agent.validation.a2a_message_validator import (
     A2AMessageValidator,
     A2AValidationResult,
 )
 
+from tests.unit.a2a_responses import build_response
+
+# Keep this module on one xdist worker (``pytest -n auto --dist=loadgroup``) so
+# its session-scoped helper is built once per run
+pytestmark = pytest.mark.xdist_group("a2a_unit")
+
+
+async def _aiter(items, kind=None):
+    """Yield ``items`` as an async stream, like a streaming send_message.
+
+    With ``kind``, each item is wrapped by ``build_response`` first; an empty
+    ``items`` stands in for an agent that sends nothing.
+    """
+    for item in items:
+        yield build_response(item, kind)
+
+
+def _mk_card(**fields):
+    """Build a lightweight agent card exposing only ``fields``."""
+    return SimpleNamespace(**fields)
+
+
+def _mk_resolver(card=None, error=None):
+    """Build a card resolver whose get_agent_card returns ``card`` or raises."""
+    resolver = Mock()
+    resolver.get_agent_card = AsyncMock(return_value=card, side_effect=error)
+    return resolver
+
+
+def _artifact_payload(text):
+    """Build the ``{"artifacts": [{"parts": [{"text": ...}]}]}`` response shape."""
+    return {"artifacts": [{"parts": [{"text": text}]}]}
+
+
+# Canonical send_message payloads, built once at import
+_HELLO_PAYLOAD = _artifact_payload("Hello from agent")
+_CONTEXT_PAYLOAD = {"parts": [{"text": "Response with context"}]}
+_TASK_PAYLOAD = _artifact_payload("Task response content")
+# Partial, complete, then a fallback status message that should be filtered out
+_STREAMING_PAYLOADS = (
+    _artifact_payload("Partial..."),
+    _artifact_payload("This is the complete response from the agent."),
+    _artifact_payload("Task completed: Task"),
+)
+
+
+# (payload, response kind, expected extracted text)
+EXTRACT_CASES = [
+    pytest.param(
+        _artifact_payload("Response from artifacts"),
+        "model_dump",
+        "Response from artifacts",
+        id="model_dump_artifacts",
+    ),
+    pytest.param(
+        {"parts": [{"text": "Direct parts response"}]},
+        "model_dump",
+        "Direct parts response",
+        id="model_dump_parts",
+    ),
+    pytest.param(
+        _artifact_payload("Task artifact content"),
+        "task_tuple",
+        "Task artifact content",
+        id="tuple_task_artifacts",
+    ),
+    pytest.param(
+        {"history": [{"role": "agent", "parts": [{"text": "History response"}]}]},
+        "task_tuple",
+        "History response",
+        id="tuple_task_history",
+    ),
+    pytest.param(
+        {"status": {"message": {"parts": [{"text": "Status message content"}]}}},
+        "task_tuple",
+        "Status message content",
+        id="tuple_task_status",
+    ),
+    pytest.param(
+        "Simple string response", "raw", "Simple string response", id="string"
+    ),
+    pytest.param(
+        {"content": "Dict content response"}, "raw", "Dict content response", id="dict"
+    ),
+]
+
+
+# Prebuilt validation outcomes; mocked scenarios append copies of these
+_PASS_CARD = A2AValidationResult(
+    scenario="agent_card_discovery",
+    success=True,
+    duration_ms=50.0,
+    details={"agent_name": "Test Agent", "capabilities": []},
+)
+_PASS_CONNECTION = A2AValidationResult(
+    scenario="client_connection",
+    success=True,
+    duration_ms=30.0,
+    details={"client_type": "TestClient"},
+)
+_FAIL_CONNECTION = A2AValidationResult(
+    scenario="client_connection",
+    success=False,
+    duration_ms=25.0,
+    details={},
+    error="Connection failed",
+)
+_PASS_EXCHANGE = A2AValidationResult(
+    scenario="basic_message_exchange",
+    success=True,
+    duration_ms=150.0,
+    details={"response_count": 2},
+)
+
+
+@pytest.fixture(scope="session")
+def helper():
+    """Provide a default-timeout UnifiedA2AClientHelper shared by the session."""
+    return UnifiedA2AClientHelper()
+
+
+@pytest.fixture(scope="module")
+def validator_template():
+    """Provide one default-timeout A2AMessageValidator for the module."""
+    return A2AMessageValidator()
+
+
+@pytest.fixture
+def validator(validator_template):
+    """Provide the shared validator with no recorded validation results."""
+    validator_template.validation_results.clear()
+    return validator_template
+
+
+@pytest.fixture
+def mock_httpx_client():
+    """Provide a fresh async-context-manager httpx client mock for each test."""
+    client = MagicMock(spec=httpx.AsyncClient)
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def _patch_httpx_client(monkeypatch, mock_httpx_client):
+    """Route every httpx.AsyncClient construction to the test's mock."""
+    monkeypatch.setattr("httpx.AsyncClient", lambda *args, **kwargs: mock_httpx_client)
+
 
 class TestUnifiedA2AClientHelperComprehensive:
     """Comprehensive tests for UnifiedA2AClientHelper."""
@@ -33,363 +186,273 @@ class TestUnifiedA2AClientHelperComprehensive:
 
     def test_is_available_sdk_present(self):
         """Test is_available when a2a-sdk is available."""
-        with patch("any_agent.api.unified_a2a_client_helper.A2A_SDK_AVAILABLE", True):
+        with patch.object(a2a_client_module, "A2A_SDK_AVAILABLE", True):
             assert UnifiedA2AClientHelper.is_available() is True
 
     def test_is_available_sdk_missing(self):
         """Test is_available when a2a-sdk is not available."""
-        with patch("any_agent.api.unified_a2a_client_helper.A2A_SDK_AVAILABLE", False):
+        with patch.object(a2a_client_module, "A2A_SDK_AVAILABLE", False):
             assert UnifiedA2AClientHelper.is_available() is False
 
-    @pytest.mark.asyncio
-    async def test_get_agent_info_success(self):
+    @pytest.fixture(autouse=True)
+    def _patch_a2a_client(self, monkeypatch):
+        """Replace the a2a-sdk entry points used by the helper with mocks.
+
+        Installs every SDK patch in one place so individual tests only
+        configure the mocks they care about.
+        """
+        sdk = SimpleNamespace(
+            create_text_message_object=MagicMock(),
+            Role=MagicMock(),
+            A2ACardResolver=MagicMock(),
+            ClientFactory=MagicMock(),
+            ClientConfig=MagicMock(),
+        )
+        for name, mock in vars(sdk).items():
+            monkeypatch.setattr(a2a_client_module, name, mock)
+        return sdk
+
+    async def test_get_agent_info_success(self, helper, _patch_a2a_client):
         """Test successful agent info retrieval."""
-        client = UnifiedA2AClientHelper()
 
-        mock_agent_card = Mock()
-        mock_agent_card.name = "Test Agent"
-        mock_agent_card.description = "A test agent"
-        mock_agent_card.protocol_version = "1.0.0"
+        mock_agent_card = _mk_card(
+            name="Test Agent", description="A test agent", protocol_version="1.0.0"
+        )
 
-        mock_resolver = Mock()
-        mock_resolver.get_agent_card = AsyncMock(return_value=mock_agent_card)
+        mock_resolver = _mk_resolver(mock_agent_card)
+        _patch_a2a_client.A2ACardResolver.return_value = mock_resolver
 
-        with patch("httpx.AsyncClient") as mock_httpx:
-            with patch(
-                "any_agent.api.unified_a2a_client_helper.A2ACardResolver",
-                return_value=mock_resolver,
-            ):
-                result = await client.get_agent_info("http://localhost:8080")
+        result = await helper.get_agent_info("http://localhost:8080")
 
         assert result["name"] == "Test Agent"
         assert result["description"] == "A test agent"
         assert result["protocol_version"] == "1.0.0"
         assert result["card"] == mock_agent_card
 
-    @pytest.mark.asyncio
-    async def test_get_agent_info_missing_attributes(self):
+    async def test_get_agent_info_missing_attributes(self, helper, _patch_a2a_client):
         """Test agent info retrieval with missing attributes."""
-        client = UnifiedA2AClientHelper()
 
-        mock_agent_card = Mock(spec=["name"])  # Only has name attribute
-        mock_agent_card.name = "Test Agent"
+        mock_agent_card = _mk_card(name="Test Agent")  # Only has name
 
-        mock_resolver = Mock()
-        mock_resolver.get_agent_card = AsyncMock(return_value=mock_agent_card)
+        mock_resolver = _mk_resolver(mock_agent_card)
+        _patch_a2a_client.A2ACardResolver.return_value = mock_resolver
 
-        with patch("httpx.AsyncClient") as mock_httpx:
-            with patch(
-                "any_agent.api.unified_a2a_client_helper.A2ACardResolver",
-                return_value=mock_resolver,
-            ):
-                result = await client.get_agent_info("http://localhost:8080")
+        result = await helper.get_agent_info("http://localhost:8080")
 
         assert result["name"] == "Test Agent"
         assert result["description"] is None
         assert result["protocol_version"] == "unknown"
 
-    @pytest.mark.skip(reason="Complex mock behavior - edge case covered by other tests")
-    @pytest.mark.asyncio
-    async def test_get_agent_info_no_name(self):
-        """Test agent info retrieval with no name attribute."""
-        pass  # Skipped for now - coverage achieved elsewhere
-
-    @pytest.mark.asyncio
-    async def test_get_agent_info_sdk_unavailable(self):
-        """Test agent info retrieval when SDK is unavailable."""
-        with patch("any_agent.api.unified_a2a_client_helper.A2A_SDK_AVAILABLE", False):
-            client = UnifiedA2AClientHelper()
-
-            with pytest.raises(ImportError) as exc_info:
-                await client.get_agent_info("http://localhost:8080")
-
-            assert "a2a-sdk not available" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_send_message_basic(self):
+    @pytest.mark.parametrize(
+        "call",
+        [
+            pytest.param(
+                lambda helper: helper.get_agent_info("http://localhost:8080"),
+                id="get_agent_info",
+            ),
+            pytest.param(
+                lambda helper: helper.send_message("http://localhost:8080", "test"),
+                id="send_message",
+            ),
+        ],
+    )
+    async def test_sdk_unavailable(self, helper, call, monkeypatch):
+        """Test that SDK-backed calls raise ImportError when SDK is unavailable."""
+        monkeypatch.setattr(a2a_client_module, "A2A_SDK_AVAILABLE", False)
+        with pytest.raises(ImportError, match="a2a-sdk not available"):
+            await call(helper)
+
+    async def test_send_message_basic(self, helper, _patch_a2a_client):
         """Test basic message sending functionality."""
-        client = UnifiedA2AClientHelper()
 
         mock_agent_card = Mock()
         mock_a2a_client = AsyncMock()
-        mock_a2a_client.close = AsyncMock()
 
         # Mock streaming response
-        async def mock_response_generator():
-            mock_response = Mock()
-            mock_response.model_dump.return_value = {
-                "artifacts": [{"parts": [{"text": "Hello from agent"}]}]
-            }
-            yield mock_response
+        sent_messages = []
+        mock_a2a_client.send_message = lambda message: (
+            sent_messages.append(message) or _aiter([_HELLO_PAYLOAD], "model_dump")
+        )
 
-        mock_a2a_client.send_message = Mock(return_value=mock_response_generator())
+        mock_message = Mock()
+        _patch_a2a_client.create_text_message_object.return_value = mock_message
 
         with patch.object(
-            client,
+            helper,
             "_create_a2a_client",
             return_value=(mock_a2a_client, mock_agent_card),
         ):
-            with patch(
-                "any_agent.api.unified_a2a_client_helper.create_text_message_object"
-            ) as mock_create_msg:
-                with patch("any_agent.api.unified_a2a_client_helper.Role") as mock_role:
-                    mock_message = Mock()
-                    mock_create_msg.return_value = mock_message
-
-                    result = await client.send_message(
-                        "http://localhost:8080", "Hello agent"
-                    )
+            result = await helper.send_message("http://localhost:8080", "Hello agent")
 
         assert result == ["Hello from agent"]
-        mock_create_msg.assert_called_once_with(
-            role=mock_role.user, content="Hello agent"
+        _patch_a2a_client.create_text_message_object.assert_called_once_with(
+            role=_patch_a2a_client.Role.user, content="Hello agent"
         )
-        mock_a2a_client.send_message.assert_called_once_with(mock_message)
+        assert sent_messages == [mock_message]
         mock_a2a_client.close.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_send_message_with_context(self):
+    async def test_send_message_with_context(self, helper, _patch_a2a_client):
         """Test message sending with context ID and reference task IDs."""
-        client = UnifiedA2AClientHelper()
 
         mock_agent_card = Mock()
         mock_a2a_client = AsyncMock()
-        mock_a2a_client.close = AsyncMock()
 
         # Mock streaming response
-        async def mock_response_generator():
-            mock_response = Mock()
-            mock_response.model_dump.return_value = {
-                "parts": [{"text": "Response with context"}]
-            }
-            yield mock_response
+        mock_a2a_client.send_message = lambda message: _aiter(
+            [_CONTEXT_PAYLOAD], "model_dump"
+        )
 
-        mock_a2a_client.send_message = Mock(return_value=mock_response_generator())
+        mock_message = Mock()
+        _patch_a2a_client.create_text_message_object.return_value = mock_message
 
         with patch.object(
-            client,
+            helper,
             "_create_a2a_client",
             return_value=(mock_a2a_client, mock_agent_card),
         ):
-            with patch(
-                "any_agent.api.unified_a2a_client_helper.create_text_message_object"
-            ) as mock_create_msg:
-                with patch("any_agent.api.unified_a2a_client_helper.Role") as mock_role:
-                    mock_message = Mock()
-                    mock_create_msg.return_value = mock_message
-
-                    result = await client.send_message(
-                        "http://localhost:8080",
-                        "Hello with context",
-                        context_id="ctx-123",
-                        reference_task_ids=["task-1", "task-2"],
-                        parent_message_id="msg-456",
-                    )
+            result = await helper.send_message(
+                "http://localhost:8080",
+                "Hello with context",
+                context_id="ctx-123",
+                reference_task_ids=["task-1", "task-2"],
+                parent_message_id="msg-456",
+            )
 
         assert result == ["Response with context"]
         assert mock_message.context_id == "ctx-123"
         assert mock_message.reference_task_ids == ["task-1", "task-2"]
 
-    @pytest.mark.asyncio
-    async def test_send_message_streaming_responses(self):
+    @pytest.mark.parametrize(
+        "context_id,reference_task_ids",
+        [
+            pytest.param("session-123", ["task-1"], id="single_task"),
+            pytest.param(
+                "ctx-abc-def-456", ["task-1", "task-2", "task-3"], id="many_tasks"
+            ),
+            pytest.param("", [], id="empty"),
+            pytest.param(None, None, id="none"),
+        ],
+    )
+    async def test_send_message_context_fields(
+        self, helper, _patch_a2a_client, context_id, reference_task_ids
+    ):
+        """Test context fields are set on the message only when non-empty."""
+        mock_a2a_client = AsyncMock()
+        mock_a2a_client.send_message = lambda message: _aiter([])
+
+        # A plain object, so fields the helper never sets stay absent
+        message = SimpleNamespace()
+        _patch_a2a_client.create_text_message_object.return_value = message
+
+        with patch.object(
+            helper,
+            "_create_a2a_client",
+            return_value=(mock_a2a_client, Mock()),
+        ):
+            await helper.send_message(
+                "http://localhost:8080",
+                "Hello with context",
+                context_id=context_id,
+                reference_task_ids=reference_task_ids,
+            )
+
+        assert getattr(message, "context_id", None) == (context_id or None)
+        assert getattr(message, "reference_task_ids", None) == (
+            reference_task_ids or None
+        )
+
+    async def test_send_message_streaming_responses(self, helper):
         """Test handling of streaming responses from agent."""
-        client = UnifiedA2AClientHelper()
 
         mock_agent_card = Mock()
         mock_a2a_client = AsyncMock()
-        mock_a2a_client.close = AsyncMock()
 
         # Mock multiple streaming responses
-        async def mock_response_generator():
-            # Partial response
-            mock_response1 = Mock()
-            mock_response1.model_dump.return_value = {
-                "artifacts": [{"parts": [{"text": "Partial..."}]}]
-            }
-            yield mock_response1
-
-            # Full response
-            mock_response2 = Mock()
-            mock_response2.model_dump.return_value = {
-                "artifacts": [
-                    {
-                        "parts": [
-                            {"text": "This is the complete response from the agent."}
-                        ]
-                    }
-                ]
-            }
-            yield mock_response2
-
-            # Fallback response (should be filtered)
-            mock_response3 = Mock()
-            mock_response3.model_dump.return_value = {
-                "artifacts": [{"parts": [{"text": "Task completed: Task"}]}]
-            }
-            yield mock_response3
-
-        mock_a2a_client.send_message = Mock(return_value=mock_response_generator())
+        mock_a2a_client.send_message = lambda message: _aiter(
+            _STREAMING_PAYLOADS, "model_dump"
+        )
 
         with patch.object(
-            client,
+            helper,
             "_create_a2a_client",
             return_value=(mock_a2a_client, mock_agent_card),
         ):
-            with patch(
-                "any_agent.api.unified_a2a_client_helper.create_text_message_object"
-            ):
-                result = await client.send_message(
-                    "http://localhost:8080", "Hello streaming"
-                )
+            result = await helper.send_message(
+                "http://localhost:8080", "Hello streaming"
+            )
 
         # Should return the longest meaningful response
         assert result == ["This is the complete response from the agent."]
 
-    @pytest.mark.asyncio
-    async def test_send_message_tuple_response(self):
+    @pytest.mark.parametrize(
+        "responses,expected",
+        [
+            pytest.param(
+                ["Partial...", "Complete response", "Task completed: Task"],
+                "Complete response",
+                id="longest_meaningful",
+            ),
+            pytest.param(
+                ["Response: Task", "Task completed: Task"],
+                "Task completed: Task",
+                id="fallback_only",
+            ),
+        ],
+    )
+    def test_pick_best_response(self, helper, responses, expected):
+        """Test final response selection for streaming agents."""
+        assert helper._pick_best_response(responses) == expected
+
+    async def test_send_message_tuple_response(self, helper):
         """Test handling of tuple responses from Google ADK style agents."""
-        client = UnifiedA2AClientHelper()
 
         mock_agent_card = Mock()
         mock_a2a_client = AsyncMock()
-        mock_a2a_client.close = AsyncMock()
 
         # Mock tuple response (Google ADK pattern)
-        async def mock_response_generator():
-            mock_task_obj = Mock()
-            mock_task_obj.model_dump.return_value = {
-                "artifacts": [{"parts": [{"text": "Task response content"}]}]
-            }
-            yield (mock_task_obj,)
-
-        mock_a2a_client.send_message = Mock(return_value=mock_response_generator())
+        mock_a2a_client.send_message = lambda message: _aiter(
+            [_TASK_PAYLOAD], "task_tuple"
+        )
 
         with patch.object(
-            client,
+            helper,
             "_create_a2a_client",
             return_value=(mock_a2a_client, mock_agent_card),
         ):
-            with patch(
-                "any_agent.api.unified_a2a_client_helper.create_text_message_object"
-            ):
-                result = await client.send_message(
-                    "http://localhost:8080", "Hello task"
-                )
+            result = await helper.send_message("http://localhost:8080", "Hello task")
 
         assert result == ["Task response content"]
 
-    @pytest.mark.asyncio
-    async def test_send_message_sdk_unavailable(self):
-        """Test message sending when SDK is unavailable."""
-        with patch("any_agent.api.unified_a2a_client_helper.A2A_SDK_AVAILABLE", False):
-            client = UnifiedA2AClientHelper()
-
-            with pytest.raises(ImportError) as exc_info:
-                await client.send_message("http://localhost:8080", "test")
-
-            assert "a2a-sdk not available" in str(exc_info.value)
-
-    @pytest.mark.asyncio
-    async def test_create_a2a_client_success(self):
+    async def test_create_a2a_client_success(self, helper, _patch_a2a_client):
         """Test successful A2A client creation."""
-        client = UnifiedA2AClientHelper()
 
         mock_agent_card = Mock()
         mock_a2a_client = Mock()
         mock_factory = Mock()
         mock_factory.create.return_value = mock_a2a_client
-        mock_resolver = Mock()
-        mock_resolver.get_agent_card = AsyncMock(return_value=mock_agent_card)
+        mock_resolver = _mk_resolver(mock_agent_card)
+        _patch_a2a_client.A2ACardResolver.return_value = mock_resolver
+        _patch_a2a_client.ClientFactory.return_value = mock_factory
+        mock_httpx_client = Mock()
 
-        with patch(
-            "any_agent.api.unified_a2a_client_helper.A2ACardResolver",
-            return_value=mock_resolver,
-        ):
-            with patch(
-                "any_agent.api.unified_a2a_client_helper.ClientFactory",
-                return_value=mock_factory,
-            ):
-                with patch(
-                    "any_agent.api.unified_a2a_client_helper.ClientConfig"
-                ) as mock_config_class:
-                    mock_httpx_client = Mock()
-
-                    result_client, result_card = await client._create_a2a_client(
-                        "http://localhost:8080", mock_httpx_client
-                    )
+        result_client, result_card = await helper._create_a2a_client(
+            "http://localhost:8080", mock_httpx_client
+        )
 
         assert result_client == mock_a2a_client
         assert result_card == mock_agent_card
-        mock_config_class.assert_called_once_with(
+        _patch_a2a_client.ClientConfig.assert_called_once_with(
             httpx_client=mock_httpx_client, streaming=False
         )
 
-    def test_extract_response_content_model_dump_artifacts(self):
-        """Test response content extraction from artifacts using model_dump."""
-        client = UnifiedA2AClientHelper()
-
-        mock_response = Mock()
-        mock_response.model_dump.return_value = {
-            "artifacts": [{"parts": [{"text": "Response from artifacts"}]}]
-        }
-
-        result = client._extract_response_content(mock_response)
-        assert result == "Response from artifacts"
-
-    def test_extract_response_content_model_dump_parts(self):
-        """Test response content extraction from direct parts using model_dump."""
-        client = UnifiedA2AClientHelper()
-
-        mock_response = Mock()
-        mock_response.model_dump.return_value = {
-            "parts": [{"text": "Direct parts response"}]
-        }
-
-        result = client._extract_response_content(mock_response)
-        assert result == "Direct parts response"
-
-    def test_extract_response_content_tuple_task_artifacts(self):
-        """Test response content extraction from tuple task artifacts."""
-        client = UnifiedA2AClientHelper()
-
-        mock_task_obj = Mock()
-        mock_task_obj.model_dump.return_value = {
-            "artifacts": [{"parts": [{"text": "Task artifact content"}]}]
-        }
-
-        mock_response = (mock_task_obj,)
-        result = client._extract_response_content(mock_response)
-        assert result == "Task artifact content"
-
-    def test_extract_response_content_tuple_task_history(self):
-        """Test response content extraction from tuple task history."""
-        client = UnifiedA2AClientHelper()
-
-        mock_task_obj = Mock()
-        mock_task_obj.model_dump.return_value = {
-            "history": [{"role": "agent", "parts": [{"text": "History response"}]}]
-        }
-
-        mock_response = (mock_task_obj,)
-        result = client._extract_response_content(mock_response)
-        assert result == "History response"
+    @pytest.mark.parametrize("payload,kind,expected", EXTRACT_CASES)
+    def test_extract_response_content(self, helper, payload, kind, expected):
+        """Test response content extraction across supported response shapes."""
+        response = build_response(payload, kind)
+        assert helper._extract_response_content(response) == expected
 
-    def test_extract_response_content_tuple_task_status(self):
-        """Test response content extraction from tuple task status."""
-        client = UnifiedA2AClientHelper()
-
-        mock_task_obj = Mock()
-        mock_task_obj.model_dump.return_value = {
-            "status": {"message": {"parts": [{"text": "Status message content"}]}}
-        }
-
-        mock_response = (mock_task_obj,)
-        result = client._extract_response_content(mock_response)
-        assert result == "Status message content"
-
-    def test_extract_response_content_tuple_direct_attributes(self):
+    def test_extract_response_content_tuple_direct_attributes(self, helper):
         """Test response content extraction from tuple direct attributes."""
-        client = UnifiedA2AClientHelper()
 
         mock_artifact = Mock()
         mock_artifact.content = "Direct artifact content"
@@ -399,89 +462,91 @@ class TestUnifiedA2AClientHelperComprehensive:
         mock_task_obj.artifacts = [mock_artifact]
 
         mock_response = (mock_task_obj,)
-        result = client._extract_response_content(mock_response)
+        result = helper._extract_response_content(mock_response)
         assert result == "Direct artifact content"
 
-    def test_extract_response_content_string(self):
-        """Test response content extraction from string response."""
-        client = UnifiedA2AClientHelper()
-        result = client._extract_response_content("Simple string response")
-        assert result == "Simple string response"
-
-    def test_extract_response_content_dict(self):
-        """Test response content extraction from dict response."""
-        client = UnifiedA2AClientHelper()
-
-        response_dict = {"content": "Dict content response"}
-        result = client._extract_response_content(response_dict)
-        assert result == "Dict content response"
-
-    def test_extract_response_content_unknown_type(self):
+    def test_extract_response_content_unknown_type(self, helper):
         """Test response content extraction from unknown response type."""
-        client = UnifiedA2AClientHelper()
 
         class UnknownResponse:
             pass
 
-        result = client._extract_response_content(UnknownResponse())
+        result = helper._extract_response_content(UnknownResponse())
         assert result == "Response: UnknownResponse"
 
-    def test_extract_response_content_extraction_failure(self):
+    def test_extract_response_content_extraction_failure(self, helper):
         """Test response content extraction when extraction fails."""
-        client = UnifiedA2AClientHelper()
 
         mock_response = Mock()
         mock_response.model_dump.side_effect = Exception("Extraction failed")
 
-        result = client._extract_response_content(mock_response)
+        result = helper._extract_response_content(mock_response)
         assert "extraction failed" in result.lower()
 
-    def test_extract_from_framework_specific_format_content(self):
+    def test_extract_from_framework_specific_format_content(self, helper):
         """Test framework-specific format extraction with content field."""
-        client = UnifiedA2AClientHelper()
 
         response_data = {"content": "Framework content"}
-        result = client._extract_from_framework_specific_format(response_data)
+        result = helper._extract_from_framework_specific_format(response_data)
         assert result == "Framework content"
 
-    def test_extract_from_framework_specific_format_list(self):
+    def test_extract_from_framework_specific_format_list(self, helper):
         """Test framework-specific format extraction with list content."""
-        client = UnifiedA2AClientHelper()
 
         response_data = {
             "text": [{"text": "List item content"}, {"text": "Second item"}]
         }
-        result = client._extract_from_framework_specific_format(response_data)
+        result = helper._extract_from_framework_specific_format(response_data)
         assert result == "List item content"
 
-    def test_extract_from_framework_specific_format_nested_dict(self):
+    def test_extract_from_framework_specific_format_nested_dict(self, helper):
         """Test framework-specific format extraction with nested dict."""
-        client = UnifiedA2AClientHelper()
 
         response_data = {"message": {"content": "Nested dict content"}}
-        result = client._extract_from_framework_specific_format(response_data)
+        result = helper._extract_from_framework_specific_format(response_data)
         assert result == "Nested dict content"
 
-    def test_extract_from_dict_response_various_fields(self):
-        """Test dict response extraction with various field names."""
-        client = UnifiedA2AClientHelper()
-
-        test_cases = [
+    @pytest.mark.parametrize(
+        "payload,expected",
+        [
             ({"content": "Content field"}, "Content field"),
             ({"text": "Text field"}, "Text field"),
             ({"message": "Message field"}, "Message field"),
             ({"response": "Response field"}, "Response field"),
             ({"output": "Output field"}, "Output field"),
-        ]
-
-        for response_dict, expected in test_cases:
-            result = client._extract_from_dict_response(response_dict)
-            assert result == expected
+        ],
+    )
+    def test_extract_from_dict_response_various_fields(self, helper, payload, expected):
+        """Test dict response extraction with various field names."""
+        assert helper._extract_from_dict_response(payload) == expected
 
 
 class TestA2AMessageValidatorComprehensive:
     """Comprehensive tests for A2AMessageValidator."""
 
+    @pytest.fixture
+    def a2a_mocks(self, monkeypatch):
+        """Replace the a2a-sdk entry points used by the validator with mocks.
+
+        The resolver and factory instances are exposed directly so tests can
+        set the agent card or created client without nesting patches.
+        """
+        mocks = SimpleNamespace(
+            resolver=_mk_resolver(),
+            factory=Mock(),
+            ClientConfig=Mock(),
+            create_text_message_object=Mock(),
+        )
+        patched = {
+            "A2ACardResolver": Mock(return_value=mocks.resolver),
+            "ClientFactory": Mock(return_value=mocks.factory),
+            "ClientConfig": mocks.ClientConfig,
+            "create_text_message_object": mocks.create_text_message_object,
+        }
+        for name, mock in patched.items():
+            monkeypatch.setattr(a2a_validator_module, name, mock)
+        return mocks
+
     def test_init_default_timeout(self):
         """Test A2AMessageValidator initialization with default timeout."""
         validator = A2AMessageValidator()
@@ -495,25 +560,17 @@ class TestA2AMessageValidatorComprehensive:
 
     def test_is_a2a_validation_available_true(self):
         """Test is_a2a_validation_available when SDK is available."""
-        with patch(
-            "any_agent.validation.a2a_message_validator.A2A_SDK_AVAILABLE", True
-        ):
+        with patch.object(a2a_validator_module, "A2A_SDK_AVAILABLE", True):
             assert A2AMessageValidator.is_a2a_validation_available() is True
 
     def test_is_a2a_validation_available_false(self):
         """Test is_a2a_validation_available when SDK is unavailable."""
-        with patch(
-            "any_agent.validation.a2a_message_validator.A2A_SDK_AVAILABLE", False
-        ):
+        with patch.object(a2a_validator_module, "A2A_SDK_AVAILABLE", False):
             assert A2AMessageValidator.is_a2a_validation_available() is False
 
-    @pytest.mark.asyncio
-    async def test_validate_agent_a2a_protocol_sdk_unavailable(self):
+    async def test_validate_agent_a2a_protocol_sdk_unavailable(self, validator):
         """Test protocol validation when SDK is unavailable."""
-        with patch(
-            "any_agent.validation.a2a_message_validator.A2A_SDK_AVAILABLE", False
-        ):
-            validator = A2AMessageValidator()
+        with patch.object(a2a_validator_module, "A2A_SDK_AVAILABLE", False):
             result = await validator.validate_agent_a2a_protocol(8080)
 
         assert result["success"] is False
@@ -523,48 +580,30 @@ class TestA2AMessageValidatorComprehensive:
         assert result["summary"]["passed"] == 0
         assert result["summary"]["failed"] == 0
 
-    @pytest.mark.asyncio
-    async def test_validate_agent_a2a_protocol_all_pass(self):
+    async def test_validate_agent_a2a_protocol_all_pass(self, validator, monkeypatch):
         """Test protocol validation with all tests passing."""
-        validator = A2AMessageValidator()
 
         # Mock successful validation methods
         async def mock_card_discovery(base_url, httpx_client):
-            validator.validation_results.append(
-                A2AValidationResult(
-                    scenario="agent_card_discovery",
-                    success=True,
-                    duration_ms=50.0,
-                    details={"agent_name": "Test Agent", "capabilities": []},
-                )
-            )
+            validator.validation_results.append(copy.copy(_PASS_CARD))
 
         async def mock_client_connection(base_url, httpx_client):
-            validator.validation_results.append(
-                A2AValidationResult(
-                    scenario="client_connection",
-                    success=True,
-                    duration_ms=30.0,
-                    details={"client_type": "TestClient"},
-                )
-            )
+            validator.validation_results.append(copy.copy(_PASS_CONNECTION))
 
         async def mock_message_exchange(base_url, httpx_client):
-            validator.validation_results.append(
-                A2AValidationResult(
-                    scenario="basic_message_exchange",
-                    success=True,
-                    duration_ms=150.0,
-                    details={"response_count": 2},
-                )
-            )
+            validator.validation_results.append(copy.copy(_PASS_EXCHANGE))
 
-        validator._validate_agent_card_discovery = mock_card_discovery
-        validator._validate_client_connection = mock_client_connection
-        validator._validate_basic_message_exchange = mock_message_exchange
+        monkeypatch.setattr(
+            validator, "_validate_agent_card_discovery", mock_card_discovery
+        )
+        monkeypatch.setattr(
+            validator, "_validate_client_connection", mock_client_connection
+        )
+        monkeypatch.setattr(
+            validator, "_validate_basic_message_exchange", mock_message_exchange
+        )
 
-        with patch("httpx.AsyncClient"):
-            result = await validator.validate_agent_a2a_protocol(8080)
+        result = await validator.validate_agent_a2a_protocol(8080)
 
         assert result["success"] is True
         assert len(result["validations"]) == 3
@@ -572,49 +611,32 @@ class TestA2AMessageValidatorComprehensive:
         assert result["summary"]["passed"] == 3
         assert result["summary"]["failed"] == 0
 
-    @pytest.mark.asyncio
-    async def test_validate_agent_a2a_protocol_mixed_results(self):
+    async def test_validate_agent_a2a_protocol_mixed_results(
+        self, validator, monkeypatch
+    ):
         """Test protocol validation with mixed pass/fail results."""
-        validator = A2AMessageValidator()
 
         # Mock mixed validation results
         async def mock_card_discovery(base_url, httpx_client):
-            validator.validation_results.append(
-                A2AValidationResult(
-                    scenario="agent_card_discovery",
-                    success=True,
-                    duration_ms=50.0,
-                    details={"agent_name": "Test Agent"},
-                )
-            )
+            validator.validation_results.append(copy.copy(_PASS_CARD))
 
         async def mock_client_connection(base_url, httpx_client):
-            validator.validation_results.append(
-                A2AValidationResult(
-                    scenario="client_connection",
-                    success=False,
-                    duration_ms=25.0,
-                    details={},
-                    error="Connection failed",
-                )
-            )
+            validator.validation_results.append(copy.copy(_FAIL_CONNECTION))
 
         async def mock_message_exchange(base_url, httpx_client):
-            validator.validation_results.append(
-                A2AValidationResult(
-                    scenario="basic_message_exchange",
-                    success=True,
-                    duration_ms=100.0,
-                    details={"response_count": 1},
-                )
-            )
+            validator.validation_results.append(copy.copy(_PASS_EXCHANGE))
 
-        validator._validate_agent_card_discovery = mock_card_discovery
-        validator._validate_client_connection = mock_client_connection
-        validator._validate_basic_message_exchange = mock_message_exchange
+        monkeypatch.setattr(
+            validator, "_validate_agent_card_discovery", mock_card_discovery
+        )
+        monkeypatch.setattr(
+            validator, "_validate_client_connection", mock_client_connection
+        )
+        monkeypatch.setattr(
+            validator, "_validate_basic_message_exchange", mock_message_exchange
+        )
 
-        with patch("httpx.AsyncClient"):
-            result = await validator.validate_agent_a2a_protocol(8080)
+        result = await validator.validate_agent_a2a_protocol(8080)
 
         assert result["success"] is False  # One failure makes overall fail
         assert len(result["validations"]) == 3
@@ -622,11 +644,8 @@ class TestA2AMessageValidatorComprehensive:
         assert result["summary"]["passed"] == 2
         assert result["summary"]["failed"] == 1
 
-    @pytest.mark.asyncio
-    async def test_validate_agent_a2a_protocol_exception(self):
+    async def test_validate_agent_a2a_protocol_exception(self, validator):
         """Test protocol validation with exception during execution."""
-        validator = A2AMessageValidator()
-
         with patch("httpx.AsyncClient", side_effect=Exception("Connection error")):
             result = await validator.validate_agent_a2a_protocol(8080)
 
@@ -636,27 +655,15 @@ class TestA2AMessageValidatorComprehensive:
         assert validator.validation_results[0].success is False
         assert "Connection error" in validator.validation_results[0].error
 
-    @pytest.mark.asyncio
-    async def test_validate_agent_card_discovery_success(self):
+    async def test_validate_agent_card_discovery_success(self, validator, a2a_mocks):
         """Test successful agent card discovery validation."""
-        validator = A2AMessageValidator()
-
-        mock_agent_card = Mock()
-        mock_agent_card.name = "Test Agent"
-        mock_agent_card.version = "2.0.0"
-        mock_agent_card.capabilities = ["chat", "search"]
+        mock_agent_card = _mk_card(
+            name="Test Agent", version="2.0.0", capabilities=["chat", "search"]
+        )
 
-        mock_resolver = Mock()
-        mock_resolver.get_agent_card = AsyncMock(return_value=mock_agent_card)
+        a2a_mocks.resolver.get_agent_card.return_value = mock_agent_card
 
-        with patch(
-            "any_agent.validation.a2a_message_validator.A2ACardResolver",
-            return_value=mock_resolver,
-        ):
-            mock_httpx_client = Mock()
-            await validator._validate_agent_card_discovery(
-                "http://localhost:8080", mock_httpx_client
-            )
+        await validator._validate_agent_card_discovery("http://localhost:8080", Mock())
 
         assert len(validator.validation_results) == 1
         result = validator.validation_results[0]
@@ -667,25 +674,15 @@ class TestA2AMessageValidatorComprehensive:
         assert result.details["capabilities"] == ["chat", "search"]
         assert result.error is None
 
-    @pytest.mark.asyncio
-    async def test_validate_agent_card_discovery_missing_name(self):
+    async def test_validate_agent_card_discovery_missing_name(
+        self, validator, a2a_mocks
+    ):
         """Test agent card discovery validation with missing name."""
-        validator = A2AMessageValidator()
+        mock_agent_card = _mk_card(capabilities=["chat"])  # Only capabilities
 
-        mock_agent_card = Mock(spec=["capabilities"])  # Only has capabilities attribute
-        mock_agent_card.capabilities = ["chat"]
+        a2a_mocks.resolver.get_agent_card.return_value = mock_agent_card
 
-        mock_resolver = Mock()
-        mock_resolver.get_agent_card = AsyncMock(return_value=mock_agent_card)
-
-        with patch(
-            "any_agent.validation.a2a_message_validator.A2ACardResolver",
-            return_value=mock_resolver,
-        ):
-            mock_httpx_client = Mock()
-            await validator._validate_agent_card_discovery(
-                "http://localhost:8080", mock_httpx_client
-            )
+        await validator._validate_agent_card_discovery("http://localhost:8080", Mock())
 
         assert len(validator.validation_results) == 1
         result = validator.validation_results[0]
@@ -694,25 +691,15 @@ class TestA2AMessageValidatorComprehensive:
         assert "name" in result.error
         assert "missing 'name' field" in result.details["validation_errors"][0]
 
-    @pytest.mark.asyncio
-    async def test_validate_agent_card_discovery_missing_capabilities(self):
+    async def test_validate_agent_card_discovery_missing_capabilities(
+        self, validator, a2a_mocks
+    ):
         """Test agent card discovery validation with missing capabilities."""
-        validator = A2AMessageValidator()
+        mock_agent_card = _mk_card(name="Test Agent")  # Only has name
 
-        mock_agent_card = Mock(spec=["name"])  # Only has name attribute
-        mock_agent_card.name = "Test Agent"
+        a2a_mocks.resolver.get_agent_card.return_value = mock_agent_card
 
-        mock_resolver = Mock()
-        mock_resolver.get_agent_card = AsyncMock(return_value=mock_agent_card)
-
-        with patch(
-            "any_agent.validation.a2a_message_validator.A2ACardResolver",
-            return_value=mock_resolver,
-        ):
-            mock_httpx_client = Mock()
-            await validator._validate_agent_card_discovery(
-                "http://localhost:8080", mock_httpx_client
-            )
+        await validator._validate_agent_card_discovery("http://localhost:8080", Mock())
 
         assert len(validator.validation_results) == 1
         result = validator.validation_results[0]
@@ -721,24 +708,13 @@ class TestA2AMessageValidatorComprehensive:
         assert "capabilities" in result.error
         assert "missing 'capabilities' field" in result.details["validation_errors"][0]
 
-    @pytest.mark.asyncio
-    async def test_validate_agent_card_discovery_exception(self):
+    async def test_validate_agent_card_discovery_exception(self, validator, a2a_mocks):
         """Test agent card discovery validation with exception."""
-        validator = A2AMessageValidator()
-
-        mock_resolver = Mock()
-        mock_resolver.get_agent_card = AsyncMock(
-            side_effect=Exception("Card resolution failed")
+        a2a_mocks.resolver.get_agent_card.side_effect = Exception(
+            "Card resolution failed"
         )
 
-        with patch(
-            "any_agent.validation.a2a_message_validator.A2ACardResolver",
-            return_value=mock_resolver,
-        ):
-            mock_httpx_client = Mock()
-            await validator._validate_agent_card_discovery(
-                "http://localhost:8080", mock_httpx_client
-            )
+        await validator._validate_agent_card_discovery("http://localhost:8080", Mock())
 
         assert len(validator.validation_results) == 1
         result = validator.validation_results[0]
@@ -747,34 +723,15 @@ class TestA2AMessageValidatorComprehensive:
         assert "Card resolution failed" in result.error
         assert result.details["error_type"] == "Exception"
 
-    @pytest.mark.asyncio
-    async def test_validate_client_connection_success(self):
+    async def test_validate_client_connection_success(self, validator, a2a_mocks):
         """Test successful client connection validation."""
-        validator = A2AMessageValidator()
-
         mock_agent_card = Mock()
         mock_client = Mock()
-        mock_factory = Mock()
-        mock_factory.create.return_value = mock_client
+        a2a_mocks.factory.create.return_value = mock_client
 
-        mock_resolver = Mock()
-        mock_resolver.get_agent_card = AsyncMock(return_value=mock_agent_card)
+        a2a_mocks.resolver.get_agent_card.return_value = mock_agent_card
 
-        with patch(
-            "any_agent.validation.a2a_message_validator.A2ACardResolver",
-            return_value=mock_resolver,
-        ):
-            with patch(
-                "any_agent.validation.a2a_message_validator.ClientFactory",
-                return_value=mock_factory,
-            ):
-                with patch(
-                    "any_agent.validation.a2a_message_validator.ClientConfig"
-                ) as mock_config:
-                    mock_httpx_client = Mock()
-                    await validator._validate_client_connection(
-                        "http://localhost:8080", mock_httpx_client
-                    )
+        await validator._validate_client_connection("http://localhost:8080", Mock())
 
         assert len(validator.validation_results) == 1
         result = validator.validation_results[0]
@@ -784,24 +741,11 @@ class TestA2AMessageValidatorComprehensive:
         assert "factory_type" in result.details
         assert result.details["initialization"] == "success"
 
-    @pytest.mark.asyncio
-    async def test_validate_client_connection_exception(self):
+    async def test_validate_client_connection_exception(self, validator, a2a_mocks):
         """Test client connection validation with exception."""
-        validator = A2AMessageValidator()
+        a2a_mocks.resolver.get_agent_card.side_effect = Exception("Resolver failed")
 
-        mock_resolver = Mock()
-        mock_resolver.get_agent_card = AsyncMock(
-            side_effect=Exception("Resolver failed")
-        )
-
-        with patch(
-            "any_agent.validation.a2a_message_validator.A2ACardResolver",
-            return_value=mock_resolver,
-        ):
-            mock_httpx_client = Mock()
-            await validator._validate_client_connection(
-                "http://localhost:8080", mock_httpx_client
-            )
+        await validator._validate_client_connection("http://localhost:8080", Mock())
 
         assert len(validator.validation_results) == 1
         result = validator.validation_results[0]
@@ -809,51 +753,29 @@ class TestA2AMessageValidatorComprehensive:
         assert result.success is False
         assert "Resolver failed" in result.error
 
-    @pytest.mark.asyncio
-    async def test_validate_basic_message_exchange_success(self):
+    async def test_validate_basic_message_exchange_success(self, validator, a2a_mocks):
         """Test successful basic message exchange validation."""
-        validator = A2AMessageValidator()
-
         mock_agent_card = Mock()
         mock_client = Mock()
-        mock_factory = Mock()
-        mock_factory.create.return_value = mock_client
+        a2a_mocks.factory.create.return_value = mock_client
 
         # Mock message responses
-        async def mock_response_generator():
-            # Task response
-            mock_task = Mock()
-            yield (mock_task,)
-
-            # Message response - need to simulate proper Message detection
-            mock_message = Mock()
-            mock_message.__class__ = type(
-                "TestMessage", (), {}
-            )  # Create a proper class
-            yield mock_message
-
-        mock_client.send_message = Mock(return_value=mock_response_generator())
-
-        mock_resolver = Mock()
-        mock_resolver.get_agent_card = AsyncMock(return_value=mock_agent_card)
-
-        with patch(
-            "any_agent.validation.a2a_message_validator.A2ACardResolver",
-            return_value=mock_resolver,
-        ):
-            with patch(
-                "any_agent.validation.a2a_message_validator.ClientFactory",
-                return_value=mock_factory,
-            ):
-                with patch("any_agent.validation.a2a_message_validator.ClientConfig"):
-                    with patch(
-                        "any_agent.validation.a2a_message_validator.create_text_message_object"
-                    ) as mock_create_msg:
-                        mock_create_msg.return_value = Mock()
-                        mock_httpx_client = Mock()
-                        await validator._validate_basic_message_exchange(
-                            "http://localhost:8080", mock_httpx_client
-                        )
+        # Task response
+        mock_task = Mock()
+
+        # Message response - need to simulate proper Message detection
+        mock_message = Mock()
+        mock_message.__class__ = type("TestMessage", (), {})  # Create a proper class
+
+        mock_client.send_message = Mock(
+            return_value=_aiter([(mock_task,), mock_message])
+        )
+
+        a2a_mocks.resolver.get_agent_card.return_value = mock_agent_card
+
+        await validator._validate_basic_message_exchange(
+            "http://localhost:8080", Mock()
+        )
 
         assert len(validator.validation_results) == 1
         result = validator.validation_results[0]
@@ -864,42 +786,22 @@ class TestA2AMessageValidatorComprehensive:
         assert result.details["total_response_types"]["tasks"] == 1
         assert result.details["total_response_types"]["messages"] == 1
 
-    @pytest.mark.asyncio
-    async def test_validate_basic_message_exchange_no_responses(self):
+    async def test_validate_basic_message_exchange_no_responses(
+        self, validator, a2a_mocks
+    ):
         """Test basic message exchange validation with no responses."""
-        validator = A2AMessageValidator()
-
         mock_agent_card = Mock()
         mock_client = Mock()
-        mock_factory = Mock()
-        mock_factory.create.return_value = mock_client
+        a2a_mocks.factory.create.return_value = mock_client
 
         # Mock empty response generator
-        async def mock_response_generator():
-            return
-            yield  # Unreachable but required for generator
+        mock_client.send_message = Mock(return_value=_aiter([]))
 
-        mock_client.send_message = Mock(return_value=mock_response_generator())
+        a2a_mocks.resolver.get_agent_card.return_value = mock_agent_card
 
-        mock_resolver = Mock()
-        mock_resolver.get_agent_card = AsyncMock(return_value=mock_agent_card)
-
-        with patch(
-            "any_agent.validation.a2a_message_validator.A2ACardResolver",
-            return_value=mock_resolver,
-        ):
-            with patch(
-                "any_agent.validation.a2a_message_validator.ClientFactory",
-                return_value=mock_factory,
-            ):
-                with patch("any_agent.validation.a2a_message_validator.ClientConfig"):
-                    with patch(
-                        "any_agent.validation.a2a_message_validator.create_text_message_object"
-                    ):
-                        mock_httpx_client = Mock()
-                        await validator._validate_basic_message_exchange(
-                            "http://localhost:8080", mock_httpx_client
-                        )
+        await validator._validate_basic_message_exchange(
+            "http://localhost:8080", Mock()
+        )
 
         assert len(validator.validation_results) == 1
         result = validator.validation_results[0]
@@ -908,24 +810,17 @@ class TestA2AMessageValidatorComprehensive:
         assert result.error == "No responses received"
         assert result.details["response_count"] == 0
 
-    @pytest.mark.asyncio
-    async def test_validate_basic_message_exchange_exception(self):
+    async def test_validate_basic_message_exchange_exception(
+        self, validator, a2a_mocks
+    ):
         """Test basic message exchange validation with exception."""
-        validator = A2AMessageValidator()
-
-        mock_resolver = Mock()
-        mock_resolver.get_agent_card = AsyncMock(
-            side_effect=Exception("Message exchange failed")
+        a2a_mocks.resolver.get_agent_card.side_effect = Exception(
+            "Message exchange failed"
         )
 
-        with patch(
-            "any_agent.validation.a2a_message_validator.A2ACardResolver",
-            return_value=mock_resolver,
-        ):
-            mock_httpx_client = Mock()
-            await validator._validate_basic_message_exchange(
-                "http://localhost:8080", mock_httpx_client
-            )
+        await validator._validate_basic_message_exchange(
+            "http://localhost:8080", Mock()
+        )
 
         assert len(validator.validation_results) == 1
         result = validator.validation_results[0]
@@ -933,10 +828,8 @@ class TestA2AMessageValidatorComprehensive:
         assert result.success is False
         assert "Message exchange failed" in result.error
 
-    def test_validation_result_to_dict(self):
+    def test_validation_result_to_dict(self, validator):
         """Test conversion of validation result to dictionary."""
-        validator = A2AMessageValidator()
-
         result = A2AValidationResult(
             scenario="test_scenario",
             success=True,
@@ -953,10 +846,8 @@ class TestA2AMessageValidatorComprehensive:
         assert result_dict["details"] == {"test": "data"}
         assert result_dict["error"] is None
 
-    def test_validation_result_to_dict_with_error(self):
+    def test_validation_result_to_dict_with_error(self, validator):
         """Test conversion of validation result with error to dictionary."""
-        validator = A2AMessageValidator()
-
         result = A2AValidationResult(
             scenario="failed_test",
             success=False,
@@ -977,141 +868,114 @@ class TestA2AMessageValidatorComprehensive:
 class TestA2AValidationResultComprehensive:
     """Comprehensive tests for A2AValidationResult dataclass."""
 
-    def test_a2a_validation_result_basic_creation(self):
-        """Test basic creation of A2AValidationResult."""
-        result = A2AValidationResult(
-            scenario="test_scenario",
-            success=True,
-            duration_ms=100.0,
-            details={"key": "value"},
-        )
-
-        assert result.scenario == "test_scenario"
-        assert result.success is True
-        assert result.duration_ms == 100.0
-        assert result.details == {"key": "value"}
-        assert result.error is None
-
-    def test_a2a_validation_result_with_error(self):
-        """Test creation of A2AValidationResult with error."""
-        result = A2AValidationResult(
-            scenario="failed_test",
-            success=False,
-            duration_ms=75.5,
-            details={"attempt": 1},
-            error="Validation failed",
-        )
-
-        assert result.scenario == "failed_test"
-        assert result.success is False
-        assert result.duration_ms == 75.5
-        assert result.details == {"attempt": 1}
-        assert result.error == "Validation failed"
-
-    def test_a2a_validation_result_empty_details(self):
-        """Test A2AValidationResult with empty details."""
-        result = A2AValidationResult(
-            scenario="empty_test", success=True, duration_ms=0.0, details={}
-        )
-
-        assert result.details == {}
-        assert result.error is None
-
-    def test_a2a_validation_result_complex_details(self):
-        """Test A2AValidationResult with complex details structure."""
-        complex_details = {
-            "agent_info": {
-                "name": "Complex Agent",
-                "version": "2.1.0",
-                "features": ["chat", "search", "analysis"],
-            },
-            "performance": {"response_time_ms": 150, "success_rate": 0.95},
-            "metadata": {
-                "test_timestamp": "2024-01-15T10:30:00Z",
-                "environment": "test",
-            },
+    @pytest.mark.parametrize(
+        "scenario,success,duration_ms,details,error",
+        [
+            pytest.param(
+                "test_scenario", True, 100.0, {"key": "value"}, None, id="basic"
+            ),
+            pytest.param(
+                "failed_test",
+                False,
+                75.5,
+                {"attempt": 1},
+                "Validation failed",
+                id="with_error",
+            ),
+            pytest.param("empty_test", True, 0.0, {}, None, id="empty_details"),
+            pytest.param(
+                "complex_validation",
+                True,
+                200.25,
+                {
+                    "agent_info": {
+                        "name": "Complex Agent",
+                        "version": "2.1.0",
+                        "features": ["chat", "search", "analysis"],
+                    },
+                    "performance": {"response_time_ms": 150, "success_rate": 0.95},
+                    "metadata": {
+                        "test_timestamp": "2024-01-15T10:30:00Z",
+                        "environment": "test",
+                    },
+                },
+                None,
+                id="complex_details",
+            ),
+        ],
+    )
+    def test_a2a_validation_result(
+        self, scenario, success, duration_ms, details, error
+    ):
+        """Test A2AValidationResult creation across result shapes."""
+        fields = {
+            "scenario": scenario,
+            "success": success,
+            "duration_ms": duration_ms,
+            "details": details,
         }
+        if error is not None:
+            fields["error"] = error
 
-        result = A2AValidationResult(
-            scenario="complex_validation",
-            success=True,
-            duration_ms=200.25,
-            details=complex_details,
-        )
+        result = A2AValidationResult(**fields)
 
-        assert result.details["agent_info"]["name"] == "Complex Agent"
-        assert result.details["performance"]["success_rate"] == 0.95
-        assert len(result.details["agent_info"]["features"]) == 3
+        for name, expected in {**fields, "error": error}.items():
+            assert getattr(result, name) == expected, name
 
 
 class TestA2AProtocolIntegrationPatterns:
     """Test A2A protocol integration patterns and edge cases."""
 
-    @pytest.mark.asyncio
     async def test_multiple_client_sessions(self):
         """Test handling multiple concurrent A2A client sessions."""
         clients = [UnifiedA2AClientHelper(timeout=15) for _ in range(3)]
 
-        mock_agent_card = Mock()
-        mock_agent_card.name = "Multi-session Agent"
-        mock_agent_card.description = "Test agent"
-        mock_agent_card.protocol_version = "1.0.0"
+        mock_agent_card = _mk_card(
+            name="Multi-session Agent",
+            description="Test agent",
+            protocol_version="1.0.0",
+        )
 
         responses = []
 
         async def mock_get_info(client_id):
-            with patch("httpx.AsyncClient"):
-                with patch(
-                    "any_agent.api.unified_a2a_client_helper.A2ACardResolver"
-                ) as mock_resolver_class:
-                    mock_resolver = Mock()
-                    mock_resolver.get_agent_card = AsyncMock(
-                        return_value=mock_agent_card
-                    )
-                    mock_resolver_class.return_value = mock_resolver
-
-                    info = await clients[client_id].get_agent_info(
-                        "http://localhost:8080"
-                    )
-                    responses.append((client_id, info))
-
-        # Run multiple sessions concurrently
-        await asyncio.gather(*[mock_get_info(i) for i in range(3)])
+            info = await clients[client_id].get_agent_info("http://localhost:8080")
+            responses.append((client_id, info))
+
+        # Patch once for all sessions; httpx is already patched module-wide
+        with patch.object(
+            a2a_client_module,
+            "A2ACardResolver",
+            return_value=_mk_resolver(mock_agent_card),
+        ):
+            # Run multiple sessions concurrently
+            await asyncio.gather(*[mock_get_info(i) for i in range(3)])
 
         assert len(responses) == 3
         for client_id, info in responses:
             assert info["name"] == "Multi-session Agent"
 
-    @pytest.mark.asyncio
     async def test_long_running_message_exchange(self):
         """Test long-running message exchange scenarios."""
         client = UnifiedA2AClientHelper(timeout=300)  # Extended timeout
 
         mock_agent_card = Mock()
         mock_a2a_client = AsyncMock()
-        mock_a2a_client.close = AsyncMock()
 
         # Simulate long response with many streaming parts
-        async def mock_long_response_generator():
-            for i in range(20):
-                mock_response = Mock()
-                mock_response.model_dump.return_value = {
-                    "artifacts": [{"parts": [{"text": f"Part {i} of long response"}]}]
-                }
-                yield mock_response
-                # Simulate processing delay
-                await asyncio.sleep(0.001)
-
-        mock_a2a_client.send_message = Mock(return_value=mock_long_response_generator())
+        mock_a2a_client.send_message = Mock(
+            return_value=_aiter(
+                [_artifact_payload(f"Part {i} of long response") for i in range(20)],
+                "model_dump",
+            )
+        )
 
         with patch.object(
             client,
             "_create_a2a_client",
             return_value=(mock_a2a_client, mock_agent_card),
         ):
-            with patch(
-                "any_agent.api.unified_a2a_client_helper.create_text_message_object"
-            ):
+            with patch.object(a2a_client_module, "create_text_message_object"):
                 result = await client.send_message(
                     "http://localhost:8080", "Long running query"
                 )
@@ -1122,86 +986,27 @@ class TestA2AProtocolIntegrationPatterns:
         # But the exact response depends on streaming behavior, so check for reasonable content
         assert "Part " in result[0] and "long response" in result[0]
 
-    def test_context_preservation_patterns(self):
-        """Test context preservation patterns in A2A protocol."""
-        client = UnifiedA2AClientHelper()
-
-        # Test context ID format validation
-        context_ids = [
-            "session-123",
-            "ctx-abc-def-456",
-            "user_session_2024_01_15",
-            None,
-            "",
-        ]
-
-        reference_task_patterns = [["task-1"], ["task-1", "task-2", "task-3"], [], None]
-
-        # All combinations should be handled gracefully
-        for ctx_id in context_ids:
-            for ref_tasks in reference_task_patterns:
-                # This would be tested in integration, here we just verify
-                # the pattern is structurally sound
-                assert isinstance(ctx_id, (str, type(None)))
-                assert isinstance(ref_tasks, (list, type(None)))
-
-    def test_error_recovery_patterns(self):
-        """Test error recovery patterns in A2A protocol operations."""
-        client = UnifiedA2AClientHelper()
-
-        # Test various error conditions that should be handled
-        error_scenarios = [
-            ("Connection timeout", "timeout"),
-            ("Invalid agent card", "card_error"),
-            ("Protocol mismatch", "protocol_error"),
-            ("Authentication failed", "auth_error"),
-            ("Rate limit exceeded", "rate_limit"),
-        ]
-
-        for error_msg, error_type in error_scenarios:
-            # Verify error patterns are identifiable
-            assert error_type in [
-                "timeout",
-                "card_error",
-                "protocol_error",
-                "auth_error",
-                "rate_limit",
-            ]
-            assert isinstance(error_msg, str)
-            assert len(error_msg) > 0
-
-    @pytest.mark.asyncio
-    async def test_response_streaming_edge_cases(self):
+    async def test_response_streaming_edge_cases(self, helper):
         """Test edge cases in response streaming handling."""
-        client = UnifiedA2AClientHelper()
 
         # Test empty response handling
         mock_agent_card = Mock()
         mock_a2a_client = AsyncMock()
-        mock_a2a_client.close = AsyncMock()
-
-        async def empty_response_generator():
-            return
-            yield  # Unreachable
 
-        mock_a2a_client.send_message = Mock(return_value=empty_response_generator())
+        mock_a2a_client.send_message = Mock(return_value=_aiter([]))
 
         with patch.object(
-            client,
+            helper,
             "_create_a2a_client",
             return_value=(mock_a2a_client, mock_agent_card),
         ):
-            with patch(
-                "any_agent.api.unified_a2a_client_helper.create_text_message_object"
-            ):
-                result = await client.send_message("http://localhost:8080", "test")
+            with patch.object(a2a_client_module, "create_text_message_object"):
+                result = await helper.send_message("http://localhost:8080", "test")
 
         assert result == []  # Empty response should return empty list
 
-    def test_protocol_compliance_validation(self):
+    def test_protocol_compliance_validation(self, validator):
         """Test A2A protocol compliance validation patterns."""
-        validator = A2AMessageValidator()
-
         # Test validation result structure compliance
         test_result = A2AValidationResult(
             scenario="compliance_test",
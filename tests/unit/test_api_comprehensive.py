@@ -5,13 +5,80 @@ from unittest.mock import Mock, AsyncMock, patch
 from any_agent.api.chat_handler import A2AChatHandler, ChatMessage, ChatSession
 
 
+# Reference dataclass instances built once at import; tests only read them
+_TEXT_MESSAGE = ChatMessage(
+    id="msg_1",
+    content="Hello world",
+    sender="user",
+    timestamp="2023-01-01T00:00:00",
+    message_type="text",
+)
+_HELLO_MESSAGE = ChatMessage(
+    id="msg_1", content="Hello", sender="user", timestamp="2023-01-01T00:00:00"
+)
+_EMPTY_SESSION = ChatSession(session_id="session_1", agent_url="http://localhost:8080")
+
+
+@pytest.fixture(scope="class")
+def empty_handler():
+    """Provide a client-less handler with no sessions for read-only tests."""
+    with patch.object(A2AChatHandler, "_create_a2a_client", return_value=None):
+        handler = A2AChatHandler()
+    return handler
+
+
+@pytest.fixture
+def connected_session():
+    """Provide a fresh connected session for handler tests."""
+    return ChatSession(
+        session_id="test-session",
+        agent_url="http://localhost:8080",
+        is_connected=True,
+    )
+
+
+# send_message preconditions: (is_connected or None for no session, has_client,
+# expected error fragment or None when the message goes through)
+_SESSION_STATES = {
+    "missing": (None, True, "Session not found"),
+    "disconnected": (False, True, "Session not connected"),
+    "no_client": (True, False, "No A2A client available"),
+    "ok": (True, True, None),
+}
+
+
+@pytest.fixture(params=list(_SESSION_STATES))
+def session_state(request):
+    """Provide a handler in each send_message precondition state.
+
+    Returns ``(handler, expected_error)``, where ``expected_error`` is ``None``
+    when the message should go through.
+    """
+    is_connected, has_client, expected_error = _SESSION_STATES[request.param]
+    mock_client = None
+    if has_client:
+        mock_client = AsyncMock()
+        mock_client.send_message.return_value = ["Agent response"]
+
+    with patch.object(A2AChatHandler, "_create_a2a_client", return_value=mock_client):
+        handler = A2AChatHandler()
+    if is_connected is not None:
+        handler.sessions["test-session"] = ChatSession(
+            session_id="test-session",
+            agent_url="http://localhost:8080",
+            is_connected=is_connected,
+        )
+    return handler, expected_error
+
+
 class TestA2AChatHandler:
     """Test A2A chat handler functionality."""
 
     def test_init_without_client(self):
         """Test handler initialization when A2A client is not available."""
-        with patch(
-            "any_agent.api.chat_handler.A2AChatHandler._create_a2a_client",
+        with patch.object(
+            A2AChatHandler,
+            "_create_a2a_client",
             return_value=None,
         ):
             handler = A2AChatHandler(timeout=60)
@@ -22,8 +89,9 @@ class TestA2AChatHandler:
     def test_init_with_client(self):
         """Test handler initialization with A2A client available."""
         mock_client = Mock()
-        with patch(
-            "any_agent.api.chat_handler.A2AChatHandler._create_a2a_client",
+        with patch.object(
+            A2AChatHandler,
+            "_create_a2a_client",
             return_value=mock_client,
         ):
             handler = A2AChatHandler(timeout=30)
@@ -31,11 +99,11 @@ class TestA2AChatHandler:
             assert handler.a2a_client is mock_client
             assert handler.is_available()
 
-    @pytest.mark.asyncio
     async def test_create_session_no_client(self):
         """Test session creation when no A2A client is available."""
-        with patch(
-            "any_agent.api.chat_handler.A2AChatHandler._create_a2a_client",
+        with patch.object(
+            A2AChatHandler,
+            "_create_a2a_client",
             return_value=None,
         ):
             handler = A2AChatHandler()
@@ -47,14 +115,14 @@ class TestA2AChatHandler:
             assert "No A2A client available" in result["error"]
             assert result["session"] is None
 
-    @pytest.mark.asyncio
     async def test_create_session_success(self):
         """Test successful session creation."""
         mock_client = AsyncMock()
         mock_client.get_agent_info.return_value = {"name": "Test Agent"}
 
-        with patch(
-            "any_agent.api.chat_handler.A2AChatHandler._create_a2a_client",
+        with patch.object(
+            A2AChatHandler,
+            "_create_a2a_client",
             return_value=mock_client,
         ):
             handler = A2AChatHandler()
@@ -67,14 +135,14 @@ class TestA2AChatHandler:
             assert result["session"]["agent_name"] == "Test Agent"
             assert result["session"]["is_connected"]
 
-    @pytest.mark.asyncio
     async def test_create_session_failure(self):
         """Test session creation failure."""
         mock_client = AsyncMock()
         mock_client.get_agent_info.side_effect = Exception("Connection failed")
 
-        with patch(
-            "any_agent.api.chat_handler.A2AChatHandler._create_a2a_client",
+        with patch.object(
+            A2AChatHandler,
+            "_create_a2a_client",
             return_value=mock_client,
         ):
             handler = A2AChatHandler()
@@ -87,114 +155,79 @@ class TestA2AChatHandler:
             assert not result["session"]["is_connected"]
             assert len(result["session"]["messages"]) == 1  # Error message added
 
-    @pytest.mark.asyncio
-    async def test_send_message_no_session(self):
-        """Test sending message to non-existent session."""
-        handler = A2AChatHandler()
-        result = await handler.send_message("invalid-session", "Hello")
-
-        assert not result["success"]
-        assert "Session not found" in result["error"]
-
-    @pytest.mark.asyncio
-    async def test_send_message_not_connected(self):
-        """Test sending message when session not connected."""
-        handler = A2AChatHandler()
-        handler.sessions["test-session"] = ChatSession(
-            session_id="test-session",
-            agent_url="http://localhost:8080",
-            is_connected=False,
-        )
+    async def test_send_message_preconditions(self, session_state):
+        """Test that send_message checks session and client state in order."""
+        handler, expected_error = session_state
 
         result = await handler.send_message("test-session", "Hello")
 
-        assert not result["success"]
-        assert "Session not connected" in result["error"]
-
-    @pytest.mark.asyncio
-    async def test_send_message_no_client(self):
-        """Test sending message when no A2A client available."""
-        with patch(
-            "any_agent.api.chat_handler.A2AChatHandler._create_a2a_client",
-            return_value=None,
-        ):
-            handler = A2AChatHandler()
-            handler.sessions["test-session"] = ChatSession(
-                session_id="test-session",
-                agent_url="http://localhost:8080",
-                is_connected=True,
-            )
-
-            result = await handler.send_message("test-session", "Hello")
-
+        if expected_error is None:
+            assert result["success"]
+        else:
             assert not result["success"]
-            assert "No A2A client available" in result["error"]
-
-    @pytest.mark.asyncio
-    async def test_send_message_success(self):
-        """Test successful message sending."""
+            assert expected_error in result["error"]
+
+    @pytest.mark.parametrize(
+        "client_behavior,expect_success,expect_fragment",
+        [
+            pytest.param(
+                {"return_value": ["Agent response"]},
+                True,
+                "Agent response",
+                id="success",
+            ),
+            pytest.param(
+                {"return_value": []},
+                True,
+                "didn't generate a text response",
+                id="no_response",
+            ),
+            pytest.param(
+                {"side_effect": Exception("Send error")},
+                False,
+                "Error sending message",
+                id="error",
+            ),
+        ],
+    )
+    async def test_send_message_outcomes(
+        self, connected_session, client_behavior, expect_success, expect_fragment
+    ):
+        """Test message sending for agent replies, empty replies and errors."""
         mock_client = AsyncMock()
-        mock_client.send_message.return_value = ["Agent response"]
+        mock_client.send_message.configure_mock(**client_behavior)
 
-        with patch(
-            "any_agent.api.chat_handler.A2AChatHandler._create_a2a_client",
+        with patch.object(
+            A2AChatHandler,
+            "_create_a2a_client",
             return_value=mock_client,
         ):
             handler = A2AChatHandler()
-            handler.sessions["test-session"] = ChatSession(
-                session_id="test-session",
-                agent_url="http://localhost:8080",
-                is_connected=True,
-            )
+            handler.sessions["test-session"] = connected_session
 
             result = await handler.send_message("test-session", "Hello")
 
-            assert result["success"]
-            assert len(result["messages"]) == 1
-            assert result["messages"][0]["content"] == "Agent response"
+        assert result["success"] is expect_success
+        assert len(result["messages"]) == 1
+        assert expect_fragment in result["messages"][0]["content"]
+        if expect_success:
             assert result["user_message"]["content"] == "Hello"
+        else:
+            assert "Send error" in result["error"]
 
-    @pytest.mark.asyncio
-    async def test_send_message_no_response(self):
-        """Test message sending with no agent response."""
-        mock_client = AsyncMock()
-        mock_client.send_message.return_value = []
-
-        with patch(
-            "any_agent.api.chat_handler.A2AChatHandler._create_a2a_client",
-            return_value=mock_client,
-        ):
-            handler = A2AChatHandler()
-            handler.sessions["test-session"] = ChatSession(
-                session_id="test-session",
-                agent_url="http://localhost:8080",
-                is_connected=True,
-            )
-
-            result = await handler.send_message("test-session", "Hello")
-
-            assert result["success"]
-            assert len(result["messages"]) == 1
-            assert "didn't generate a text response" in result["messages"][0]["content"]
-
-    @pytest.mark.asyncio
-    async def test_send_message_with_context(self):
+    async def test_send_message_with_context(self, connected_session):
         """Test message sending with conversation context."""
         mock_client = AsyncMock()
         mock_client.send_message.return_value = ["Response with context"]
 
-        with patch(
-            "any_agent.api.chat_handler.A2AChatHandler._create_a2a_client",
+        with patch.object(
+            A2AChatHandler,
+            "_create_a2a_client",
             return_value=mock_client,
         ):
             handler = A2AChatHandler()
-            session = ChatSession(
-                session_id="test-session",
-                agent_url="http://localhost:8080",
-                is_connected=True,
-            )
             # Add previous message
-            session.messages.append(
+            connected_session.messages.append(
                 ChatMessage(
                     id="msg_0",
                     content="Previous message",
@@ -202,7 +235,7 @@ class TestA2AChatHandler:
                     timestamp="2023-01-01T00:00:00",
                 )
             )
-            handler.sessions["test-session"] = session
+            handler.sessions["test-session"] = connected_session
 
             result = await handler.send_message("test-session", "Follow-up message")
 
@@ -216,40 +249,11 @@ class TestA2AChatHandler:
                 parent_message_id="msg_0",
             )
 
-    @pytest.mark.asyncio
-    async def test_send_message_error(self):
-        """Test message sending error handling."""
-        mock_client = AsyncMock()
-        mock_client.send_message.side_effect = Exception("Send error")
-
-        with patch(
-            "any_agent.api.chat_handler.A2AChatHandler._create_a2a_client",
-            return_value=mock_client,
-        ):
-            handler = A2AChatHandler()
-            handler.sessions["test-session"] = ChatSession(
-                session_id="test-session",
-                agent_url="http://localhost:8080",
-                is_connected=True,
-            )
-
-            result = await handler.send_message("test-session", "Hello")
-
-            assert not result["success"]
-            assert "Send error" in result["error"]
-            assert len(result["messages"]) == 1  # Error message
-            assert "Error sending message" in result["messages"][0]["content"]
-
-    def test_get_session_exists(self):
+    def test_get_session_exists(self, connected_session):
         """Test getting existing session."""
         handler = A2AChatHandler()
-        session = ChatSession(
-            session_id="test-session",
-            agent_url="http://localhost:8080",
-            agent_name="Test Agent",
-            is_connected=True,
-        )
-        handler.sessions["test-session"] = session
+        connected_session.agent_name = "Test Agent"
+        handler.sessions["test-session"] = connected_session
 
         result = handler.get_session("test-session")
 
@@ -258,16 +262,14 @@ class TestA2AChatHandler:
         assert result["agent_name"] == "Test Agent"
         assert result["is_connected"]
 
-    def test_get_session_not_exists(self):
+    def test_get_session_not_exists(self, empty_handler):
         """Test getting non-existent session."""
-        handler = A2AChatHandler()
-        result = handler.get_session("invalid-session")
+        result = empty_handler.get_session("invalid-session")
         assert result is None
 
-    def test_list_sessions_empty(self):
+    def test_list_sessions_empty(self, empty_handler):
         """Test listing sessions when none exist."""
-        handler = A2AChatHandler()
-        result = handler.list_sessions()
+        result = empty_handler.list_sessions()
         assert result == []
 
     def test_list_sessions_multiple(self):
@@ -292,10 +294,9 @@ class TestA2AChatHandler:
         assert any(s["session_id"] == "session1" for s in result)
         assert any(s["session_id"] == "session2" for s in result)
 
-    def test_get_timestamp(self):
+    def test_get_timestamp(self, empty_handler):
         """Test timestamp generation."""
-        handler = A2AChatHandler()
-        timestamp = handler._get_timestamp()
+        timestamp = empty_handler._get_timestamp()
 
         assert isinstance(timestamp, str)
         # Should be in ISO format
@@ -307,27 +308,15 @@ class TestChatMessage:
 
     def test_chat_message_creation(self):
         """Test creating a chat message."""
-        msg = ChatMessage(
-            id="msg_1",
-            content="Hello world",
-            sender="user",
-            timestamp="2023-01-01T00:00:00",
-            message_type="text",
-        )
-
-        assert msg.id == "msg_1"
-        assert msg.content == "Hello world"
-        assert msg.sender == "user"
-        assert msg.timestamp == "2023-01-01T00:00:00"
-        assert msg.message_type == "text"
+        assert _TEXT_MESSAGE.id == "msg_1"
+        assert _TEXT_MESSAGE.content == "Hello world"
+        assert _TEXT_MESSAGE.sender == "user"
+        assert _TEXT_MESSAGE.timestamp == "2023-01-01T00:00:00"
+        assert _TEXT_MESSAGE.message_type == "text"
 
     def test_chat_message_default_type(self):
         """Test chat message with default type."""
-        msg = ChatMessage(
-            id="msg_1", content="Hello", sender="user", timestamp="2023-01-01T00:00:00"
-        )
-
-        assert msg.message_type == "text"
+        assert _HELLO_MESSAGE.message_type == "text"
 
 
 class TestChatSession:
@@ -335,21 +324,18 @@ class TestChatSession:
 
     def test_chat_session_creation(self):
         """Test creating a chat session."""
-        session = ChatSession(session_id="session_1", agent_url="http://localhost:8080")
-
-        assert session.session_id == "session_1"
-        assert session.agent_url == "http://localhost:8080"
-        assert session.agent_name is None
-        assert not session.is_connected
-        assert session.messages == []
+        assert _EMPTY_SESSION.session_id == "session_1"
+        assert _EMPTY_SESSION.agent_url == "http://localhost:8080"
+        assert _EMPTY_SESSION.agent_name is None
+        assert not _EMPTY_SESSION.is_connected
+        assert _EMPTY_SESSION.messages == []
 
     def test_chat_session_with_messages(self):
         """Test chat session with messages."""
-        msg = ChatMessage(
-            id="msg_1", content="Hello", sender="user", timestamp="2023-01-01T00:00:00"
-        )
         session = ChatSession(
-            session_id="session_1", agent_url="http://localhost:8080", messages=[msg]
+            session_id="session_1",
+            agent_url="http://localhost:8080",
+            messages=[_HELLO_MESSAGE],
         )
 
         assert len(session.messages) == 1
@@ -1,88 +1,81 @@
 """Tests for CLI interface."""
 
-import os
-from click.testing import CliRunner
+import pytest
+from unittest.mock import Mock, patch
 from any_agent.cli import main
+from any_agent.core.port_checker import PortChecker
+
+# Help output must describe the tool, its key options and mention ADK
+_HELP_TOKENS = (
+    "Universal AI Agent Containerization Framework",
+    "--framework",
+    "--port",
+    "Google ADK",
+)
+
+
+@pytest.mark.parametrize(
+    "agent_attr,extra_flags",
+    [
+        pytest.param("test_agent", [], id="normal"),
+        pytest.param("test_agent", ["--verbose"], id="verbose"),
+        pytest.param("a2a_app", ["--verbose"], id="agent_file"),
+    ],
+)
+def test_cli_dry_run(agent_fs, invoke_cli, agent_attr, extra_flags):
+    """Test CLI dry run mode with and without verbose logging."""
+    agent_path = str(getattr(agent_fs, agent_attr))
+    result = invoke_cli([agent_path, "--dry-run", *extra_flags])
 
-
-def test_cli_dry_run():
-    """Test CLI dry run mode."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem():
-        # Create a test agent directory
-        os.makedirs("test_agent")
-        with open("test_agent/a2a_app.py", "w") as f:
-            f.write("# Test agent file")
-
-        result = runner.invoke(
-            main, ["test_agent/a2a_app.py", "--dry-run", "--verbose"]
-        )
-
-        assert result.exit_code == 0
-        assert "DRY RUN" in result.output
-        assert "Any Agent Framework" in result.output
+    assert result.exit_code == 0
+    assert "DRY RUN" in result.output
+    assert "Any Agent Framework" in result.output
 
 
-def test_cli_help():
+def test_cli_help(help_result):
     """Test CLI help message."""
-    runner = CliRunner()
-    result = runner.invoke(main, ["--help"])
-
-    assert result.exit_code == 0
-    assert "Universal AI Agent Containerization Framework" in result.output
-    assert "--framework" in result.output
-    assert "--port" in result.output
-    assert "Google ADK" in result.output  # Should mention ADK in help
+    assert help_result.exit_code == 0
+    missing = [token for token in _HELP_TOKENS if token not in help_result.output]
+    assert not missing
 
 
-def test_cli_adk_framework_detection():
+def test_cli_adk_framework_detection(agent_fs, invoke_cli):
     """Test CLI with explicit ADK framework specification."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem():
-        # Create ADK-style agent directory
-        os.makedirs("adk_test")
-        with open("adk_test/__init__.py", "w") as f:
-            f.write("# ADK Agent")
-        with open("adk_test/agent.py", "w") as f:
-            f.write("# ADK agent implementation")
-
-        result = runner.invoke(main, ["adk_test", "--framework", "adk", "--dry-run"])
-
-        assert result.exit_code == 0
-        assert "DRY RUN" in result.output
+    result = invoke_cli([str(agent_fs.adk_agent), "--framework", "adk", "--dry-run"])
 
+    assert result.exit_code == 0
+    assert "DRY RUN" in result.output
 
 
-def test_cli_invalid_path():
+def test_cli_invalid_path(runner):
     """Test CLI with invalid agent path."""
-    runner = CliRunner()
-
     result = runner.invoke(main, ["non_existent_path"])
 
     assert result.exit_code != 0
     assert "does not exist" in result.output
 
 
-def test_cli_invalid_framework():
+def test_cli_invalid_framework(runner):
     """Test CLI with invalid framework choice."""
-    runner = CliRunner()
-
     result = runner.invoke(main, [".", "--framework", "invalid_framework"])
 
     assert result.exit_code != 0
     assert "Invalid value for" in result.output
 
 
-def test_cli_port_validation():
+def test_cli_port_validation(fresh_agent, runner):
     """Test CLI port validation."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem():
-        os.makedirs("test_agent")
-        with open("test_agent/__init__.py", "w") as f:
-            f.write("# Test agent")
+    # Binding port 22 only fails for unprivileged users, and a successful
+    # bind would run the full pipeline, so the denial is simulated
+    denied = {"port": 22, "available": False, "status": "permission_denied"}
+    port_checker_patch = patch.multiple(
+        PortChecker,
+        is_port_available=Mock(return_value=False),
+        get_port_info=Mock(return_value=denied),
+        find_available_port=Mock(return_value=None),
+    )
+    with runner.isolated_filesystem(), port_checker_patch:
+        fresh_agent()
 
         # Test low port (should show permission error)
         result = runner.invoke(main, ["test_agent", "--port", "22"])
@@ -92,90 +85,38 @@ def test_cli_port_validation():
         assert "permission denied" in result.output.lower()
 
 
-def test_cli_verbose_mode():
-    """Test CLI verbose logging."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem():
-        os.makedirs("test_agent")
-        with open("test_agent/__init__.py", "w") as f:
-            f.write("# Test agent")
-
-        result = runner.invoke(main, ["test_agent", "--verbose", "--dry-run"])
-
-        assert result.exit_code == 0
-        assert "DRY RUN" in result.output
-
-
-def test_cli_version_flag():
+def test_cli_version_flag(version_result):
     """Test CLI version flag functionality."""
-    runner = CliRunner()
-
-    result = runner.invoke(main, ["--version"])
+    result = version_result
 
     assert result.exit_code == 0
     assert "0.2.10" in result.output
 
 
-def test_cli_protocol_specification():
-    """Test CLI protocol specification."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem():
-        os.makedirs("test_agent")
-        with open("test_agent/__init__.py", "w") as f:
-            f.write("# Test agent")
-
-        result = runner.invoke(main, ["test_agent", "--dry-run"])
+def test_cli_comprehensive_adk_workflow(agent_fs, invoke_cli):
+    """Test complete ADK workflow in dry-run mode."""
+    result = invoke_cli(
+        [
+            str(agent_fs.adk_agent),
+            "--framework",
+            "adk",
+            "--port",
+            "8080",
+            "--agent-name",
+            "comprehensive-test-agent",
+            "--dry-run",
+            "--verbose",
+        ]
+    )
 
-        assert result.exit_code == 0
-        assert "DRY RUN" in result.output
+    assert result.exit_code == 0
+    assert "DRY RUN" in result.output
+    assert agent_fs.adk_agent.name in result.output
 
 
-def test_cli_comprehensive_adk_workflow():
-    """Test complete ADK workflow in dry-run mode."""
-    runner = CliRunner()
-
-    with runner.isolated_filesystem():
-        # Create ADK-like structure
-        os.makedirs("my_adk_agent")
-        with open("my_adk_agent/__init__.py", "w") as f:
-            f.write("# ADK Agent Root")
-        with open("my_adk_agent/agent.py", "w") as f:
-            f.write("# Agent implementation")
-        with open("my_adk_agent/requirements.txt", "w") as f:
-            f.write("google-cloud-functions\n")
-
-        result = runner.invoke(
-            main,
-            [
-                "my_adk_agent",
-                "--framework",
-                "adk",
-                "--port",
-                "8080",
-                "--agent-name",
-                "comprehensive-test-agent",
-                "--dry-run",
-                "--verbose",
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert "DRY RUN" in result.output
-        assert "my_adk_agent" in result.output
-
-
-def test_cli_error_handling_coverage():
+def test_cli_error_handling_coverage(agent_fs, invoke_cli):
     """Test various error scenarios for comprehensive coverage."""
-    runner = CliRunner()
-
     # Test with invalid agent-name format (empty)
-    with runner.isolated_filesystem():
-        os.makedirs("test_agent")
-        with open("test_agent/__init__.py", "w") as f:
-            f.write("# Test agent")
-
-        result = runner.invoke(main, ["test_agent", "--agent-name", "", "--dry-run"])
+    result = invoke_cli([str(agent_fs.test_agent), "--agent-name", "", "--dry-run"])
 
-        assert result.exit_code == 0  # Should handle gracefully
+    assert result.exit_code == 0  # Should handle gracefully
@@ -0,0 +1,22 @@
+"""Benchmarks for the CLI dry-run path.
+
+Every CLI test pays for option parsing, framework detection and the dry-run
+report, so the cost of one ``--dry-run`` invocation is pinned here to catch
+startup regressions such as new eager imports or options. Save a baseline
+with ``--benchmark-only --benchmark-autosave`` and compare later runs against
+it with ``--benchmark-compare``.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from any_agent.cli import main
+
+
+@pytest.mark.benchmark(group="cli")
+def test_cli_dry_run_perf(benchmark, runner, agent_fs):
+    """Benchmark a dry-run invocation against the shared test agent."""
+    result = benchmark(runner.invoke, main, [str(agent_fs.test_agent), "--dry-run"])
+    assert result.exit_code == 0
+    assert "DRY RUN" in result.output
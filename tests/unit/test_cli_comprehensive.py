@@ -1,430 +1,252 @@
 """Comprehensive CLI interface tests to improve coverage from 27% to 75%."""
 
-import os
-import json
-from unittest.mock import patch, Mock
-from click.testing import CliRunner
+from unittest.mock import Mock
 import pytest
-from any_agent.cli import main
-
-
-class TestCLIComprehensiveCoverage:
-    """Comprehensive CLI test suite to achieve 75% coverage target."""
 
-    def test_cli_with_directory_option(self):
-        """Test CLI with explicit directory option."""
-        runner = CliRunner()
+from any_agent.cli import main
 
-        with runner.isolated_filesystem():
-            os.makedirs("agent_dir")
-            with open("agent_dir/__init__.py", "w") as f:
-                f.write("# Agent")
 
-            result = runner.invoke(main, ["agent_dir", "-d", "agent_dir", "--dry-run"])
+# Sections and options every --help rendering must mention
+_HELP_SECTION_TOKENS = ("Options:", "--framework", "--port", "--agent-name")
 
-            assert result.exit_code == 0
 
-    def test_cli_no_build_flag(self):
-        """Test CLI with --no-build flag."""
-        runner = CliRunner()
+@pytest.fixture
+def adk_detected_mock():
+    """Provide an orchestrator instance whose detection finds a Google ADK agent."""
+    mock_adapter = type("GoogleAdkAdapter", (), {})()
+    mock_orchestrator_instance = Mock()
+    mock_orchestrator_instance.detect_framework.return_value = mock_adapter
+    return mock_orchestrator_instance
 
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
 
-            result = runner.invoke(main, ["test_agent", "--no-build", "--dry-run"])
+def _assert_ok(result, needle=None):
+    """Assert a clean exit and, if given, ``needle`` or the dry-run banner."""
+    assert result.exit_code == 0, result.output
+    if needle:
+        assert needle in result.output or "DRY RUN" in result.output, result.output
 
-            assert result.exit_code == 0
-            assert "Skip building" in result.output or "DRY RUN" in result.output
 
-    def test_cli_no_run_flag(self):
-        """Test CLI with --no-run flag."""
-        runner = CliRunner()
+class TestCLIComprehensiveCoverage:
+    """Comprehensive CLI test suite to achieve 75% coverage target."""
 
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
+    def test_cli_with_directory_option(self, agent_fs, invoke_cli):
+        """Test CLI with explicit directory option."""
+        agent_dir = str(agent_fs.agent_dir)
 
-            result = runner.invoke(main, ["test_agent", "--no-run", "--dry-run"])
+        result = invoke_cli([agent_dir, "-d", agent_dir, "--dry-run"])
 
-            assert result.exit_code == 0
+        _assert_ok(result)
 
-    def test_cli_custom_container_name(self):
-        """Test CLI with custom container name."""
-        runner = CliRunner()
+    def test_cli_no_build_flag(self, agent_fs, invoke_cli):
+        """Test CLI with --no-build flag."""
+        result = invoke_cli([str(agent_fs.test_agent), "--no-build", "--dry-run"])
 
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
+        _assert_ok(result, "Skip building")
 
-            result = runner.invoke(
-                main, ["test_agent", "--container-name", "my-custom-agent", "--dry-run"]
-            )
+    def test_cli_no_run_flag(self, agent_fs, invoke_cli):
+        """Test CLI with --no-run flag."""
+        result = invoke_cli([str(agent_fs.test_agent), "--no-run", "--dry-run"])
 
-            assert result.exit_code == 0
-            assert "my-custom-agent" in result.output or "DRY RUN" in result.output
+        _assert_ok(result)
 
-    @pytest.mark.skip(
-        reason="--push option removed during QA cleanup - unimplemented feature"
-    )
-    def test_cli_push_option(self):
-        """Test CLI with push option."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
-
-            result = runner.invoke(
-                main,
-                [
-                    "test_agent",
-                    "--push",
-                    "registry.example.com/my-agent:latest",
-                    "--dry-run",
-                ],
-            )
-
-            assert result.exit_code == 0
-
-    def test_cli_config_file_option(self):
+    def test_cli_custom_container_name(self, agent_fs, invoke_cli):
+        """Test CLI with custom container name."""
+        result = invoke_cli(
+            [
+                str(agent_fs.test_agent),
+                "--container-name",
+                "my-custom-agent",
+                "--dry-run",
+            ],
+        )
+
+        _assert_ok(result, "my-custom-agent")
+
+    def test_cli_config_file_option(self, agent_fs, invoke_cli):
         """Test CLI with config file option."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
-
-            # Create config file
-            config = {"agent": {"name": "test-config-agent", "framework": "adk"}}
-            with open("config.json", "w") as f:
-                json.dump(config, f)
-
-            result = runner.invoke(
-                main, ["test_agent", "--config", "config.json", "--dry-run"]
-            )
-
-            assert result.exit_code == 0
-
-    def test_cli_output_directory_option(self):
+        result = invoke_cli(
+            [
+                str(agent_fs.test_agent),
+                "--config",
+                str(agent_fs.config_file),
+                "--dry-run",
+            ],
+        )
+
+        _assert_ok(result)
+
+    def test_cli_output_directory_option(self, agent_fs, invoke_cli):
         """Test CLI with output directory option."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            os.makedirs("output_dir")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
-
-            result = runner.invoke(
-                main, ["test_agent", "--output", "output_dir", "--dry-run"]
-            )
-
-            assert result.exit_code == 0
-
-    @pytest.mark.skip(
-        reason="--protocol option removed during QA cleanup - unimplemented feature"
-    )
-    def test_cli_protocol_options(self):
-        """Test CLI with different protocol options."""
-        runner = CliRunner()
-        protocols = ["a2a", "openai", "websocket", "custom"]
-
-        for protocol in protocols:
-            with runner.isolated_filesystem():
-                os.makedirs("test_agent")
-                with open("test_agent/__init__.py", "w") as f:
-                    f.write("# Test agent")
-
-                result = runner.invoke(
-                    main, ["test_agent", "--protocol", protocol, "--dry-run"]
-                )
-
-                assert result.exit_code == 0
-
-    @pytest.mark.skip(
-        reason="--helmsman-token option removed during QA cleanup - unimplemented feature"
-    )
-    def test_cli_helmsman_token_option(self):
-        """Test CLI with Helmsman token option."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
-
-            result = runner.invoke(
-                main,
-                [
-                    "test_agent",
-                    "--helmsman",
-                    "--helmsman-token",
-                    "test-token-123",
-                    "--agent-name",
-                    "test-helmsman-agent",
-                    "--dry-run",
-                ],
-            )
-
-            assert result.exit_code == 0
-
-    def test_cli_no_ui_flag(self):
+        result = invoke_cli(
+            [
+                str(agent_fs.test_agent),
+                "--output",
+                str(agent_fs.output_dir),
+                "--dry-run",
+            ],
+        )
+
+        _assert_ok(result)
+
+    def test_cli_no_ui_flag(self, agent_fs, invoke_cli):
         """Test CLI with --no-ui flag."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
+        result = invoke_cli([str(agent_fs.test_agent), "--no-ui", "--dry-run"])
 
-            result = runner.invoke(main, ["test_agent", "--no-ui", "--dry-run"])
+        _assert_ok(result)
 
-            assert result.exit_code == 0
-
-    def test_cli_skip_a2a_test_flag(self):
+    def test_cli_skip_a2a_test_flag(self, agent_fs, invoke_cli):
         """Test CLI with --skip-a2a-test flag."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
+        result = invoke_cli([str(agent_fs.test_agent), "--skip-a2a-test", "--dry-run"])
 
-            result = runner.invoke(main, ["test_agent", "--skip-a2a-test", "--dry-run"])
+        _assert_ok(result)
 
-            assert result.exit_code == 0
-
-    def test_cli_a2a_test_timeout_option(self):
+    def test_cli_a2a_test_timeout_option(self, agent_fs, invoke_cli):
         """Test CLI with custom A2A test timeout."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
+        result = invoke_cli(
+            [str(agent_fs.test_agent), "--a2a-test-timeout", "60", "--dry-run"]
+        )
 
-            result = runner.invoke(
-                main, ["test_agent", "--a2a-test-timeout", "60", "--dry-run"]
-            )
+        _assert_ok(result)
 
-            assert result.exit_code == 0
-
-    def test_cli_rebuild_ui_flag(self):
+    def test_cli_rebuild_ui_flag(self, agent_fs, invoke_cli):
         """Test CLI with --rebuild-ui flag."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
+        result = invoke_cli([str(agent_fs.test_agent), "--rebuild-ui", "--dry-run"])
 
-            result = runner.invoke(main, ["test_agent", "--rebuild-ui", "--dry-run"])
+        _assert_ok(result)
 
-            assert result.exit_code == 0
-
-    def test_cli_all_framework_options(self):
+    @pytest.mark.parametrize(
+        "framework", ["auto", "adk", "aws-strands", "langchain", "crewai"]
+    )
+    def test_cli_all_framework_options(self, agent_fs, invoke_cli, framework):
         """Test CLI with all available framework options."""
-        runner = CliRunner()
-        frameworks = ["auto", "adk", "aws-strands", "langchain", "crewai"]
-
-        for framework in frameworks:
-            with runner.isolated_filesystem():
-                os.makedirs("test_agent")
-                with open("test_agent/__init__.py", "w") as f:
-                    f.write("# Test agent")
+        result = invoke_cli(
+            [str(agent_fs.test_agent), "--framework", framework, "--dry-run"]
+        )
 
-                result = runner.invoke(
-                    main, ["test_agent", "--framework", framework, "--dry-run"]
-                )
+        _assert_ok(result)
 
-                assert result.exit_code == 0
-
-    @patch("any_agent.core.docker_orchestrator.AgentOrchestrator")
-    def test_cli_framework_detection_paths(self, mock_orchestrator):
+    def test_cli_framework_detection_paths(
+        self, mock_orchestrator, adk_detected_mock, agent_fs, invoke_cli
+    ):
         """Test CLI framework detection with different outcomes."""
-        runner = CliRunner()
-
         # Test case 1: Successful framework detection
-        mock_adapter = Mock()
-        mock_adapter.__class__.__name__ = "GoogleAdkAdapter"
-        mock_orchestrator_instance = Mock()
-        mock_orchestrator_instance.detect_framework.return_value = mock_adapter
-        mock_orchestrator.return_value = mock_orchestrator_instance
-
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
+        mock_orchestrator.return_value = adk_detected_mock
 
-            result = runner.invoke(main, ["test_agent", "--verbose", "--dry-run"])
+        result = invoke_cli([str(agent_fs.test_agent), "--verbose", "--dry-run"])
 
-            assert result.exit_code == 0
+        _assert_ok(result)
 
-    @patch("any_agent.core.docker_orchestrator.AgentOrchestrator")
-    def test_cli_no_framework_detected_fallback(self, mock_orchestrator):
+    def test_cli_no_framework_detected_fallback(
+        self, mock_orchestrator, agent_fs, invoke_cli
+    ):
         """Test CLI behavior when no framework is detected."""
-        runner = CliRunner()
-
         # Mock no framework detected
         mock_orchestrator_instance = Mock()
         mock_orchestrator_instance.detect_framework.return_value = None
         mock_orchestrator.return_value = mock_orchestrator_instance
 
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
-
-            result = runner.invoke(main, ["test_agent", "--verbose", "--dry-run"])
+        result = invoke_cli([str(agent_fs.test_agent), "--verbose", "--dry-run"])
 
-            assert result.exit_code == 0
-            assert "fallback port" in result.output or "DRY RUN" in result.output
+        _assert_ok(result)
+        assert "using fallback port: 8080" in result.output
 
-    def test_cli_port_range_variations(self):
+    @pytest.mark.parametrize("port", [3000, 8080, 8090, 9000])
+    def test_cli_port_range_variations(self, agent_fs, invoke_cli, port):
         """Test CLI with various port numbers."""
-        runner = CliRunner()
-        ports = [3000, 8080, 8090, 9000]
+        result = invoke_cli(
+            [str(agent_fs.test_agent), "--port", str(port), "--dry-run"]
+        )
 
-        for port in ports:
-            with runner.isolated_filesystem():
-                os.makedirs("test_agent")
-                with open("test_agent/__init__.py", "w") as f:
-                    f.write("# Test agent")
+        _assert_ok(result)
 
-                result = runner.invoke(
-                    main, ["test_agent", "--port", str(port), "--dry-run"]
-                )
-
-                assert result.exit_code == 0
-
-    def test_cli_version_display(self):
+    def test_cli_version_display(self, version_result):
         """Test CLI version flag functionality."""
-        runner = CliRunner()
-
-        result = runner.invoke(main, ["--version"])
+        result = version_result
 
         # Should display version and exit successfully
         assert result.exit_code == 0
         assert "0.2.10" in result.output
 
-    def test_cli_base_image_option(self):
+    def test_cli_base_image_option(self, agent_fs, invoke_cli):
         """Test CLI with custom base image option."""
-        runner = CliRunner()
+        # Test with custom base image
+        result = invoke_cli(
+            [str(agent_fs.test_agent), "--base-image", "python:3.11-slim", "--dry-run"],
+        )
 
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
+        _assert_ok(result)
 
-            # Test with custom base image
-            result = runner.invoke(
-                main, ["test_agent", "--base-image", "python:3.11-slim", "--dry-run"]
-            )
+    @pytest.mark.parametrize("option", ["--push", "--protocol", "--helmsman-token"])
+    def test_cli_removed_options_absent(self, help_result, option):
+        """Test options removed during QA cleanup stay out of the CLI."""
+        assert option not in help_result.output
 
-            assert result.exit_code == 0
-
-    def test_cli_help_sections(self):
+    def test_cli_help_sections(self, help_result):
         """Test CLI help message contains required sections."""
-        runner = CliRunner()
-
-        result = runner.invoke(main, ["--help"])
-
-        assert result.exit_code == 0
-        assert "Options:" in result.output
-        assert "--framework" in result.output
-        assert "--port" in result.output
-        assert "--agent-name" in result.output
-
-    def test_cli_error_recovery(self):
-        """Test CLI error recovery behavior."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
-
-            # Test with invalid port to trigger error handling
-            result = runner.invoke(main, ["test_agent", "--port", "99999", "--dry-run"])
-
-            # Should handle error gracefully
-            assert isinstance(result.exit_code, int)
-
-    def test_cli_logging_setup_verbose(self):
-        """Test CLI logging setup in verbose mode."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
-
-            result = runner.invoke(main, ["test_agent", "--verbose", "--dry-run"])
-
-            assert result.exit_code == 0
-
-    def test_cli_logging_setup_normal(self):
-        """Test CLI logging setup in normal mode."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
-
-            result = runner.invoke(main, ["test_agent", "--dry-run"])
-
-            assert result.exit_code == 0
-
-    def test_cli_framework_specific_ports(self):
+        assert help_result.exit_code == 0
+        missing = [
+            token for token in _HELP_SECTION_TOKENS if token not in help_result.output
+        ]
+        assert not missing
+
+    def test_cli_accepts_out_of_range_port_at_parse(self, agent_fs):
+        """Test CLI accepts an out-of-range port at parse time."""
+        # --port is a plain int option; range problems surface in the port check
+        with main.make_context(
+            "main", [str(agent_fs.test_agent), "--port", "99999", "--dry-run"]
+        ) as ctx:
+            assert ctx.params["port"] == 99999
+
+    def test_cli_error_recovery(
+        self, mock_port_checker, mock_context, agent_fs, invoke_cli
+    ):
+        """Test CLI reports an unusable port and stops before the pipeline."""
+        # --dry-run skips the port check, so this runs the real path with the
+        # checker simulated; binding port 99999 itself would raise
+        mock_port_checker.is_port_available.return_value = False
+        mock_port_checker.get_port_info.return_value = {
+            "port": 99999,
+            "available": False,
+            "status": "error",
+        }
+        mock_port_checker.find_available_port.return_value = None
+
+        result = invoke_cli([str(agent_fs.test_agent), "--port", "99999"])
+
+        _assert_ok(result)
+        assert "Port 99999 is not available" in result.output
+        assert "Try a different port number" in result.output
+        mock_port_checker.is_port_available.assert_called_once_with(99999)
+
+    @pytest.mark.parametrize(
+        "framework_type,agent_dir_name",
+        [
+            ("googleadk", "google_agent"),
+            ("awsstrands", "strands_agent"),
+            ("langchain", "langchain_agent"),
+        ],
+        ids=["googleadk", "awsstrands", "langchain"],
+    )
+    def test_cli_framework_specific_ports(
+        self, make_agent_dir, invoke_cli, framework_type, agent_dir_name
+    ):
         """Test framework-specific port assignment logic."""
-        runner = CliRunner()
-
-        with runner.isolated_filesystem():
-            # Create different framework-style structures
-            frameworks = [
-                ("googleadk", "google_agent"),
-                ("awsstrands", "strands_agent"),
-                ("langchain", "langchain_agent"),
-            ]
+        agent_dir = make_agent_dir(agent_dir_name, f"# {framework_type} agent")
 
-            for framework_type, agent_dir in frameworks:
-                os.makedirs(agent_dir, exist_ok=True)
-                with open(f"{agent_dir}/__init__.py", "w") as f:
-                    f.write(f"# {framework_type} agent")
+        result = invoke_cli([str(agent_dir), "--verbose", "--dry-run"])
 
-                result = runner.invoke(main, [agent_dir, "--verbose", "--dry-run"])
+        _assert_ok(result)
 
-                assert result.exit_code == 0
-
-    def test_cli_error_handling_comprehensive(self):
+    @pytest.mark.parametrize(
+        "extra_args",
+        [
+            pytest.param(["--agent-name", ""], id="empty_agent_name"),
+            pytest.param(["--no-build", "--no-run", "--no-ui"], id="combined_flags"),
+        ],
+    )
+    def test_cli_error_handling_comprehensive(self, agent_fs, invoke_cli, extra_args):
         """Test comprehensive error handling in CLI."""
-        runner = CliRunner()
-
-        # Test with various edge cases
-        test_cases = [
-            # Empty agent name
-            [".", "--agent-name", "", "--dry-run"],
-            # Multiple flags together
-            [".", "--no-build", "--no-run", "--no-ui", "--dry-run"],
-        ]
-
-        with runner.isolated_filesystem():
-            os.makedirs("test_agent")
-            with open("test_agent/__init__.py", "w") as f:
-                f.write("# Test agent")
-
-            for test_case in test_cases:
-                # Replace "." with actual agent directory
-                test_case[0] = "test_agent"
-
-                result = runner.invoke(main, test_case)
+        result = invoke_cli([str(agent_fs.test_agent), *extra_args, "--dry-run"])
 
-                # Should handle gracefully (not crash)
-                assert isinstance(result.exit_code, int)
+        # Should handle gracefully (not crash)
+        _assert_ok(result)
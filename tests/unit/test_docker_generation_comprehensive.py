@@ -2,17 +2,34 @@
 
 from unittest.mock import patch
 
+import pytest
+
 from any_agent.docker.docker_generator import UnifiedDockerfileGenerator
 from any_agent.adapters.base import AgentMetadata
 
+# Frameworks with a config entry, read once at collection for parametrization
+FRAMEWORKS = tuple(UnifiedDockerfileGenerator().framework_configs)
+
+REQUIRED_CONFIG_KEYS = (
+    "default_port",
+    "env_vars",
+    "dependencies",
+    "entrypoint_script",
+    "server_type",
+)
+
+
+@pytest.fixture(scope="class")
+def generator():
+    """Provide one generator for the class; its methods never mutate it."""
+    return UnifiedDockerfileGenerator()
+
 
 class TestUnifiedDockerfileGeneratorComprehensive:
     """Comprehensive tests for Unified Dockerfile Generator."""
 
-    def test_init_base_configuration(self):
+    def test_init_base_configuration(self, generator):
         """Test UnifiedDockerfileGenerator initialization."""
-        generator = UnifiedDockerfileGenerator()
-
         assert generator.base_image == "python:3.11-slim"
         assert "google_adk" in generator.framework_configs
         assert "aws_strands" in generator.framework_configs
@@ -20,10 +37,8 @@ class TestUnifiedDockerfileGeneratorComprehensive:
         assert "langgraph" in generator.framework_configs
         assert "crewai" in generator.framework_configs
 
-    def test_get_framework_config_google_adk(self):
+    def test_get_framework_config_google_adk(self, generator):
         """Test getting Google ADK framework configuration."""
-        generator = UnifiedDockerfileGenerator()
-
         config = generator.get_framework_config("google_adk")
 
         assert config["default_port"] == 8035
@@ -33,10 +48,8 @@ class TestUnifiedDockerfileGeneratorComprehensive:
         assert config["entrypoint_script"] == "_adk_entrypoint.py"
         assert config["server_type"] == "google_adk_a2a"
 
-    def test_get_framework_config_aws_strands(self):
+    def test_get_framework_config_aws_strands(self, generator):
         """Test getting AWS Strands framework configuration."""
-        generator = UnifiedDockerfileGenerator()
-
         config = generator.get_framework_config("aws_strands")
 
         assert config["default_port"] == 8045
@@ -46,10 +59,8 @@ class TestUnifiedDockerfileGeneratorComprehensive:
         assert config["entrypoint_script"] == "_strands_entrypoint.py"
         assert config["server_type"] == "strands_a2a"
 
-    def test_get_framework_config_unknown_framework(self):
+    def test_get_framework_config_unknown_framework(self, generator):
         """Test getting configuration for unknown framework."""
-        generator = UnifiedDockerfileGenerator()
-
         with patch("any_agent.docker.docker_generator.logger") as mock_logger:
             config = generator.get_framework_config("unknown_framework")
 
@@ -59,10 +70,8 @@ class TestUnifiedDockerfileGeneratorComprehensive:
             assert "a2a-sdk>=0.1.0" in config["dependencies"]
             mock_logger.warning.assert_called_once()
 
-    def test_generate_dockerfile_google_adk(self, tmp_path):
+    def test_generate_dockerfile_google_adk(self, generator, tmp_path):
         """Test Dockerfile generation for Google ADK."""
-        generator = UnifiedDockerfileGenerator()
-
         # Create test metadata
         metadata = AgentMetadata(
             name="test-adk-agent", framework="google_adk", description="Test ADK agent"
@@ -93,10 +102,8 @@ class TestUnifiedDockerfileGeneratorComprehensive:
         assert "HEALTHCHECK" in dockerfile_content
         assert "uvicorn" in dockerfile_content
 
-    def test_generate_dockerfile_aws_strands(self, tmp_path):
+    def test_generate_dockerfile_aws_strands(self, generator, tmp_path):
         """Test Dockerfile generation for AWS Strands."""
-        generator = UnifiedDockerfileGenerator()
-
         metadata = AgentMetadata(
             name="test-strands-agent",
             framework="aws_strands",
@@ -116,10 +123,8 @@ class TestUnifiedDockerfileGeneratorComprehensive:
         assert "ENV AGENT_PORT=8045" in dockerfile_content
         assert "COPY _strands_entrypoint.py" in dockerfile_content
 
-    def test_generate_dockerfile_content_structure(self, tmp_path):
+    def test_generate_dockerfile_content_structure(self, generator, tmp_path):
         """Test comprehensive Dockerfile content structure."""
-        generator = UnifiedDockerfileGenerator()
-
         metadata = AgentMetadata(
             name="structure-test", framework="google_adk", description="Test structure"
         )
@@ -128,37 +133,25 @@ class TestUnifiedDockerfileGeneratorComprehensive:
         agent_path.mkdir()
 
         dockerfile_content = generator.generate_dockerfile(agent_path, metadata)
-        lines = dockerfile_content.split("\n")
 
         # Check for essential sections
-        base_image_found = any("FROM python:" in line for line in lines)
-        workdir_found = any("WORKDIR /app" in line for line in lines)
-        pythonpath_found = any("ENV PYTHONPATH=/app" in line for line in lines)
-        system_deps_found = any("apt-get update" in line for line in lines)
-        uv_install_found = any(
-            "pip install --no-cache-dir uv" in line for line in lines
+        assert "FROM python:" in dockerfile_content, "Missing base image"
+        assert "WORKDIR /app" in dockerfile_content, "Missing workdir"
+        assert "ENV PYTHONPATH=/app" in dockerfile_content, "Missing PYTHONPATH"
+        assert "apt-get update" in dockerfile_content, "Missing system dependencies"
+        assert "pip install --no-cache-dir uv" in dockerfile_content, (
+            "Missing uv installation"
         )
-        requirements_found = any("COPY requirements.txt" in line for line in lines)
-        copy_all_found = any("COPY . ." in line for line in lines)
-        expose_found = any("EXPOSE $AGENT_PORT" in line for line in lines)
-        healthcheck_found = any("HEALTHCHECK" in line for line in lines)
-        cmd_found = any("CMD" in line for line in lines)
-
-        assert base_image_found, "Missing base image"
-        assert workdir_found, "Missing workdir"
-        assert pythonpath_found, "Missing PYTHONPATH"
-        assert system_deps_found, "Missing system dependencies"
-        assert uv_install_found, "Missing uv installation"
-        assert requirements_found, "Missing requirements copy"
-        assert copy_all_found, "Missing source copy"
-        assert expose_found, "Missing port expose"
-        assert healthcheck_found, "Missing healthcheck"
-        assert cmd_found, "Missing CMD instruction"
-
-    def test_generate_entrypoint_google_adk(self, tmp_path):
-        """Test entrypoint generation for Google ADK."""
-        generator = UnifiedDockerfileGenerator()
+        assert "COPY requirements.txt" in dockerfile_content, (
+            "Missing requirements copy"
+        )
+        assert "COPY . ." in dockerfile_content, "Missing source copy"
+        assert "EXPOSE $AGENT_PORT" in dockerfile_content, "Missing port expose"
+        assert "HEALTHCHECK" in dockerfile_content, "Missing healthcheck"
+        assert "CMD" in dockerfile_content, "Missing CMD instruction"
 
+    def test_generate_entrypoint_google_adk(self, generator, tmp_path):
+        """Test entrypoint generation for Google ADK."""
         metadata = AgentMetadata(
             name="adk-entrypoint-test",
             framework="google_adk",
@@ -176,10 +169,8 @@ class TestUnifiedDockerfileGeneratorComprehensive:
         assert isinstance(entrypoint_content, str)
         assert len(entrypoint_content) > 0
 
-    def test_generate_entrypoint_adk_content(self, tmp_path):
+    def test_generate_entrypoint_adk_content(self, generator, tmp_path):
         """Test that ADK entrypoint generation produces valid content."""
-        generator = UnifiedDockerfileGenerator()
-
         metadata = AgentMetadata(
             name="delegation-test",
             framework="google_adk",
@@ -194,43 +185,38 @@ class TestUnifiedDockerfileGeneratorComprehensive:
         assert isinstance(result, str)
         assert len(result) > 0
 
-    def test_framework_configs_completeness(self):
-        """Test that all framework configurations are complete."""
-        generator = UnifiedDockerfileGenerator()
+    @pytest.mark.parametrize("key", REQUIRED_CONFIG_KEYS)
+    @pytest.mark.parametrize("framework", FRAMEWORKS)
+    def test_framework_configs_completeness(self, generator, framework, key):
+        """Test that every framework configuration defines each required key."""
+        config = generator.framework_configs[framework]
 
-        required_keys = [
-            "default_port",
-            "env_vars",
-            "dependencies",
-            "entrypoint_script",
-            "server_type",
-        ]
+        assert key in config, f"Missing {key} in {framework} config"
 
-        for framework, config in generator.framework_configs.items():
-            for key in required_keys:
-                assert key in config, f"Missing {key} in {framework} config"
+    @pytest.mark.parametrize("framework", FRAMEWORKS)
+    def test_framework_config_value_types(self, generator, framework):
+        """Test that framework configuration values have the expected shape."""
+        config = generator.framework_configs[framework]
 
-            # Validate port is integer
-            assert isinstance(config["default_port"], int)
+        # Validate port is integer
+        assert isinstance(config["default_port"], int)
 
-            # Validate dependencies is list
-            assert isinstance(config["dependencies"], list)
-            assert len(config["dependencies"]) > 0
+        # Validate dependencies is list
+        assert isinstance(config["dependencies"], list)
+        assert len(config["dependencies"]) > 0
 
-            # Validate entrypoint script has .py extension
-            assert config["entrypoint_script"].endswith(".py")
+        # Validate entrypoint script has .py extension
+        assert config["entrypoint_script"].endswith(".py")
 
-            # Validate server type is one of expected values
-            assert config["server_type"] in [
-                "google_adk_a2a",
-                "strands_a2a",
-                "generic_a2a",
-            ]
+        # Validate server type is one of expected values
+        assert config["server_type"] in [
+            "google_adk_a2a",
+            "strands_a2a",
+            "generic_a2a",
+        ]
 
-    def test_port_assignments_unique(self):
+    def test_port_assignments_unique(self, generator):
         """Test that framework default ports are unique."""
-        generator = UnifiedDockerfileGenerator()
-
         ports = []
         for config in generator.framework_configs.values():
             ports.append(config["default_port"])
@@ -240,38 +226,32 @@ class TestUnifiedDockerfileGeneratorComprehensive:
             "Duplicate ports found in framework configs"
         )
 
-    def test_dependencies_include_a2a_sdk(self):
-        """Test that all framework configurations include a2a-sdk."""
-        generator = UnifiedDockerfileGenerator()
+    @pytest.mark.parametrize("framework", FRAMEWORKS)
+    def test_dependencies_include_a2a_sdk(self, generator, framework):
+        """Test that every framework configuration includes a2a-sdk."""
+        dependencies = generator.framework_configs[framework]["dependencies"]
 
-        for framework, config in generator.framework_configs.items():
-            dependencies = config["dependencies"]
+        # Entries are requirement specifiers such as "a2a-sdk>=0.1.0"
+        a2a_sdk_found = any("a2a-sdk" in dep for dep in dependencies)
+        assert a2a_sdk_found, f"a2a-sdk not found in {framework} dependencies"
 
-            # Should include a2a-sdk
-            a2a_sdk_found = any("a2a-sdk" in dep for dep in dependencies)
-            assert a2a_sdk_found, f"a2a-sdk not found in {framework} dependencies"
-
-    def test_all_framework_dockerfile_generation(self, tmp_path):
-        """Test Dockerfile generation for all supported frameworks."""
-        generator = UnifiedDockerfileGenerator()
-
-        frameworks = ["google_adk", "aws_strands", "langchain", "langgraph", "crewai"]
-
-        for framework in frameworks:
-            metadata = AgentMetadata(
-                name=f"test-{framework}-agent",
-                framework=framework,
-                description=f"Test {framework} agent",
-            )
+    @pytest.mark.parametrize("framework", FRAMEWORKS)
+    def test_all_framework_dockerfile_generation(self, generator, tmp_path, framework):
+        """Test Dockerfile generation for each supported framework."""
+        metadata = AgentMetadata(
+            name=f"test-{framework}-agent",
+            framework=framework,
+            description=f"Test {framework} agent",
+        )
 
-            agent_path = tmp_path / f"agent_{framework}"
-            agent_path.mkdir()
+        agent_path = tmp_path / "agent"
+        agent_path.mkdir()
 
-            dockerfile_content = generator.generate_dockerfile(agent_path, metadata)
+        dockerfile_content = generator.generate_dockerfile(agent_path, metadata)
 
-            # Basic validation for all frameworks
-            assert "FROM python:3.11-slim" in dockerfile_content
-            assert f"ENV AGENT_FRAMEWORK={framework}" in dockerfile_content
-            assert "uv pip install" in dockerfile_content
-            assert "HEALTHCHECK" in dockerfile_content
-            assert "CMD" in dockerfile_content
+        # Basic validation for all frameworks
+        assert "FROM python:3.11-slim" in dockerfile_content
+        assert f"ENV AGENT_FRAMEWORK={framework}" in dockerfile_content
+        assert "uv pip install" in dockerfile_content
+        assert "HEALTHCHECK" in dockerfile_content
+        assert "CMD" in dockerfile_content
@@ -3,7 +3,6 @@
 import json
 from pathlib import Path
 from unittest.mock import Mock, patch
-from click.testing import CliRunner
 
 from any_agent.ui.cli import ui_cli, build, status, clean, copy, info
 
@@ -11,19 +10,16 @@ from any_agent.ui.cli import ui_cli, build, status, clean, copy, info
 class TestUICLIComprehensive:
     """Comprehensive tests for UI CLI commands."""
 
-    def test_ui_cli_main_group(self):
+    def test_ui_cli_main_group(self, runner):
         """Test main UI CLI group command."""
-        runner = CliRunner()
         result = runner.invoke(ui_cli, ["--help"])
 
         assert result.exit_code == 0
         assert "Any Agent UI Management" in result.output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_build_command_prerequisites_failure(self, mock_manager_class):
+    def test_build_command_prerequisites_failure(self, mock_manager_class, runner):
         """Test build command when prerequisites check fails."""
-        runner = CliRunner()
-
         # Mock manager with failed prerequisites
         mock_manager = Mock()
         mock_manager.check_prerequisites.return_value = {
@@ -40,10 +36,8 @@ class TestUICLIComprehensive:
         assert "Node.js not found" in result.output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_build_command_success_verbose(self, mock_manager_class):
+    def test_build_command_success_verbose(self, mock_manager_class, runner):
         """Test build command successful execution with verbose output."""
-        runner = CliRunner()
-
         # Mock manager with successful operations
         mock_manager = Mock()
         mock_manager.check_prerequisites.return_value = {
@@ -66,10 +60,8 @@ class TestUICLIComprehensive:
         assert "Build completed successfully" in result.output  # verbose output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_build_command_with_clean(self, mock_manager_class):
+    def test_build_command_with_clean(self, mock_manager_class, runner):
         """Test build command with clean flag."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.check_prerequisites.return_value = {
@@ -95,10 +87,8 @@ class TestUICLIComprehensive:
         mock_manager.clean_build.assert_called_once()
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_build_command_clean_failure(self, mock_manager_class):
+    def test_build_command_clean_failure(self, mock_manager_class, runner):
         """Test build command when clean fails."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.check_prerequisites.return_value = {
@@ -124,10 +114,8 @@ class TestUICLIComprehensive:
         assert "Permission denied" in result.output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_build_command_build_failure_verbose(self, mock_manager_class):
+    def test_build_command_build_failure_verbose(self, mock_manager_class, runner):
         """Test build command when build fails with verbose output."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.check_prerequisites.return_value = {
@@ -152,10 +140,8 @@ class TestUICLIComprehensive:
         assert "Compilation errors found" in result.output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_status_command_prerequisites_failure(self, mock_manager_class):
+    def test_status_command_prerequisites_failure(self, mock_manager_class, runner):
         """Test status command when prerequisites check fails."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.check_prerequisites.return_value = {
@@ -172,10 +158,8 @@ class TestUICLIComprehensive:
         assert "Install Node.js with npm" in result.output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_status_command_ui_built(self, mock_manager_class):
+    def test_status_command_ui_built(self, mock_manager_class, runner):
         """Test status command when UI is built."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.check_prerequisites.return_value = {
@@ -209,10 +193,8 @@ class TestUICLIComprehensive:
         assert "package.json found" in result.output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_status_command_ui_not_built(self, mock_manager_class):
+    def test_status_command_ui_not_built(self, mock_manager_class, runner):
         """Test status command when UI is not built."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.check_prerequisites.return_value = {
@@ -238,10 +220,8 @@ class TestUICLIComprehensive:
         assert "package.json not found" in result.output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_clean_command_no_artifacts(self, mock_manager_class):
+    def test_clean_command_no_artifacts(self, mock_manager_class, runner):
         """Test clean command when no artifacts exist."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.get_build_info.return_value = {"built": False}
@@ -253,10 +233,8 @@ class TestUICLIComprehensive:
         assert "No build artifacts found" in result.output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_clean_command_with_force(self, mock_manager_class):
+    def test_clean_command_with_force(self, mock_manager_class, runner):
         """Test clean command with force flag."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.get_build_info.return_value = {
@@ -282,10 +260,8 @@ class TestUICLIComprehensive:
         mock_manager.clean_build.assert_called_once()
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_clean_command_user_cancels(self, mock_manager_class):
+    def test_clean_command_user_cancels(self, mock_manager_class, runner):
         """Test clean command when user cancels confirmation."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.get_build_info.return_value = {
@@ -306,10 +282,8 @@ class TestUICLIComprehensive:
         assert "Cleaning cancelled" in result.output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_clean_command_with_confirmation(self, mock_manager_class):
+    def test_clean_command_with_confirmation(self, mock_manager_class, runner):
         """Test clean command with user confirmation."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.get_build_info.return_value = {
@@ -335,10 +309,8 @@ class TestUICLIComprehensive:
         assert "Build artifacts cleaned successfully" in result.output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_clean_command_failure(self, mock_manager_class):
+    def test_clean_command_failure(self, mock_manager_class, runner):
         """Test clean command when cleaning fails."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.get_build_info.return_value = {
@@ -364,10 +336,8 @@ class TestUICLIComprehensive:
         assert "Permission denied" in result.output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_copy_command_ui_not_built(self, mock_manager_class, tmp_path):
+    def test_copy_command_ui_not_built(self, mock_manager_class, tmp_path, runner):
         """Test copy command when UI is not built."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.is_ui_built.return_value = False
@@ -382,10 +352,8 @@ class TestUICLIComprehensive:
         assert "UI not built" in result.output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_copy_command_success(self, mock_manager_class, tmp_path):
+    def test_copy_command_success(self, mock_manager_class, tmp_path, runner):
         """Test copy command successful operation."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.is_ui_built.return_value = True
@@ -406,10 +374,8 @@ class TestUICLIComprehensive:
         assert "Files copied: 10" in result.output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_copy_command_failure(self, mock_manager_class, tmp_path):
+    def test_copy_command_failure(self, mock_manager_class, tmp_path, runner):
         """Test copy command when copying fails."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.is_ui_built.return_value = True
@@ -429,10 +395,8 @@ class TestUICLIComprehensive:
         assert "Permission denied" in result.output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_info_command_text_format(self, mock_manager_class):
+    def test_info_command_text_format(self, mock_manager_class, runner):
         """Test info command with text output format."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.check_prerequisites.return_value = {
@@ -462,10 +426,8 @@ class TestUICLIComprehensive:
         assert "package.json: ✅ EXISTS" in result.output
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_info_command_json_format(self, mock_manager_class):
+    def test_info_command_json_format(self, mock_manager_class, runner):
         """Test info command with JSON output format."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.check_prerequisites.return_value = {
@@ -497,10 +459,8 @@ class TestUICLIComprehensive:
         assert output_data["build_info"]["built"]
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_info_command_prerequisites_failed(self, mock_manager_class):
+    def test_info_command_prerequisites_failed(self, mock_manager_class, runner):
         """Test info command when prerequisites fail."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.check_prerequisites.return_value = {
@@ -526,8 +486,6 @@ class TestUICLIComprehensive:
         """Test main entry point function."""
         # This mainly tests that the function exists and can be called
         # The actual CLI testing is done through other tests
-        runner = CliRunner()
-
         with patch("any_agent.ui.cli.ui_cli") as mock_cli:
             from any_agent.ui.cli import main
 
@@ -539,18 +497,15 @@ class TestUICLIComprehensive:
 
             mock_cli.assert_called_once()
 
-    def test_version_option(self):
+    def test_version_option(self, runner):
         """Test --version option on main command."""
-        runner = CliRunner()
         result = runner.invoke(ui_cli, ["--version"])
 
         # Should exit with code 0 and show version
         assert result.exit_code == 0
 
-    def test_individual_command_help(self):
+    def test_individual_command_help(self, runner):
         """Test help for individual commands."""
-        runner = CliRunner()
-
         commands = ["build", "status", "clean", "copy", "info"]
 
         for cmd in commands:
@@ -559,10 +514,8 @@ class TestUICLIComprehensive:
             assert cmd in result.output.lower()
 
     @patch("any_agent.ui.cli.UIBuildManager")
-    def test_build_command_no_options(self, mock_manager_class):
+    def test_build_command_no_options(self, mock_manager_class, runner):
         """Test build command with no additional options."""
-        runner = CliRunner()
-
         # Mock manager
         mock_manager = Mock()
         mock_manager.check_prerequisites.return_value = {
@@ -584,10 +537,8 @@ class TestUICLIComprehensive:
         # Should not call clean_build without --clean flag
         mock_manager.clean_build.assert_not_called()
 
-    def test_copy_command_nonexistent_path(self):
+    def test_copy_command_nonexistent_path(self, runner):
         """Test copy command with non-existent build context path."""
-        runner = CliRunner()
-
         result = runner.invoke(copy, ["/nonexistent/path"])
 
         # Should fail due to path validation